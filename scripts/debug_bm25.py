@@ -2,6 +2,8 @@
 from rank_bm25 import BM25Okapi
 import re
 
+WORD_RE = re.compile(r"\w+")
+
 print("🧪 Debugging BM25...")
 
 lexicon = [
@@ -14,7 +16,7 @@ corpus = [f"{e['term']} {e['definition']}" for e in lexicon]
 print(f"Doc 0: '{corpus[0]}'")
 
 # Tokenization
-tokenized_corpus = [re.findall(r"\w+", doc.lower()) for doc in corpus]
+tokenized_corpus = [WORD_RE.findall(doc.lower()) for doc in corpus]
 print(f"Tokens 0: {tokenized_corpus[0]}")
 
 # Init BM25
@@ -22,7 +24,7 @@ bm25 = BM25Okapi(tokenized_corpus)
 
 # Query
 query = "reverse car"
-tokenized_query = re.findall(r"\w+", query.lower())
+tokenized_query = WORD_RE.findall(query.lower())
 print(f"Query Tokens: {tokenized_query}")
 
 # Search
@@ -2,9 +2,16 @@
 import json
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 KNOWLEDGE_FILE = "data/knowledge/v4_facts.json"
 
 def load_json(path):
+    if orjson is not None:
+        with open(path, 'rb') as f: return orjson.loads(f.read())
     with open(path, 'r') as f: return json.load(f)
 
 knowledge_base = load_json(KNOWLEDGE_FILE)
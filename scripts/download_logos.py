@@ -1,6 +1,9 @@
-import os
-import urllib.request
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
 
 LOGOS = {
     "openai": "https://github.com/openai.png",
@@ -12,33 +15,43 @@ LOGOS = {
     "opensource": "https://github.com/OpenSourceOrg.png"
 }
 
-TARGET_DIR = "benchmark-tracker/static/logos"
+TARGET_DIR = Path("benchmark-tracker/static/logos")
+MAX_WORKERS = 8
+# Use a user agent to avoid basic blocking
+HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+def make_session():
+    # One keep-alive session shared by all workers (connection + TLS reuse)
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+    return session
+
+def fetch(session, url):
+    response = session.get(url, timeout=10)
+    if response.status_code == 429:
+        # Back off briefly only when the host actually rate-limits us
+        time.sleep(0.05)
+        response = session.get(url, timeout=10)
+    response.raise_for_status()
+    return response.content
+
+def download_logo(session, name, url):
+    try:
+        filepath = TARGET_DIR / f"{name}.png"
+        
+        print(f"Downloading {name} from {url}...")
+        filepath.write_bytes(fetch(session, url))
+        print(f"Saved to {filepath}")
+        
+    except Exception as e:
+        print(f"Error downloading {name}: {e}")
 
 def download_logos():
-    if not os.path.exists(TARGET_DIR):
-        os.makedirs(TARGET_DIR)
-        print(f"Created directory: {TARGET_DIR}")
-
-    for name, url in LOGOS.items():
-        try:
-            filename = f"{name}.png"
-            filepath = os.path.join(TARGET_DIR, filename)
-            
-            print(f"Downloading {name} from {url}...")
-            
-            # Use a user agent to avoid basic blocking
-            req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-            with urllib.request.urlopen(req) as response:
-                data = response.read()
-                
-            with open(filepath, "wb") as f:
-                f.write(data)
-                
-            print(f"Saved to {filepath}")
-            time.sleep(0.5) # Be nice
-            
-        except Exception as e:
-            print(f"Error downloading {name}: {e}")
+    TARGET_DIR.mkdir(parents=True, exist_ok=True)
+
+    with make_session() as session, ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        list(pool.map(lambda kv: download_logo(session, *kv), LOGOS.items()))
 
 if __name__ == "__main__":
     download_logos()
@@ -9,14 +9,23 @@ Implements two grading styles:
 Output: JSON with scores for each method
 """
 
+import functools
 import json
 import sys
 from pathlib import Path
-from sentence_transformers import SentenceTransformer, util
 
-# Load model once
-print("Loading SentenceTransformer model...")
-EMBED_MODEL = SentenceTransformer('paraphrase-multilingual-MiniLM-L12-v2')
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+@functools.cache
+def _embed_model():
+    """Load the embedding model once, on first semantic scoring call"""
+    from sentence_transformers import SentenceTransformer
+    print("Loading SentenceTransformer model...")
+    return SentenceTransformer('paraphrase-multilingual-MiniLM-L12-v2')
 
 def score_keyword(response: str, expected_keywords: list, negative_keywords: list = None) -> float:
     """Original keyword matching (ANY match = 1.0)"""
@@ -32,32 +41,41 @@ def score_keyword(response: str, expected_keywords: list, negative_keywords: lis
         return 1.0
     return 0.0
 
-def score_semantic(response: str, expected_keywords: list) -> float:
-    """Semantic similarity between response and expected meaning"""
-    if not response or not expected_keywords:
-        return 0.0
+def score_semantic_batch(responses: list, expected_keywords_list: list) -> list:
+    """Semantic similarity for many (response, expected) pairs in one pass"""
+    scores = [0.0] * len(responses)
+    idx = [i for i, (r, e) in enumerate(zip(responses, expected_keywords_list)) if r and e]
+    if not idx:
+        return scores
     
     # Create expected meaning text
-    expected_text = " ".join(expected_keywords)
+    expected_texts = [" ".join(expected_keywords_list[i]) for i in idx]
     
-    # Get embeddings
-    resp_emb = EMBED_MODEL.encode(response, convert_to_tensor=True)
-    exp_emb = EMBED_MODEL.encode(expected_text, convert_to_tensor=True)
+    # Batch-encode both sides; unit-norm rows make cosine a row-wise dot product
+    model = _embed_model()
+    resp_emb = model.encode([responses[i] for i in idx], convert_to_tensor=True, normalize_embeddings=True)
+    exp_emb = model.encode(expected_texts, convert_to_tensor=True, normalize_embeddings=True)
     
-    # Cosine similarity
-    similarity = util.cos_sim(resp_emb, exp_emb).item()
-    return max(0.0, min(1.0, similarity))  # Clamp to 0-1
+    sims = (resp_emb * exp_emb).sum(dim=-1).clamp(0.0, 1.0).tolist()  # Clamp to 0-1
+    for i, sim in zip(idx, sims):
+        scores[i] = sim
+    return scores
+
+def score_semantic(response: str, expected_keywords: list) -> float:
+    """Semantic similarity between response and expected meaning"""
+    return score_semantic_batch([response], [expected_keywords])[0]
 
 def load_jsonl(filepath: str) -> list:
     """Load JSONL file"""
     results = []
-    with open(filepath, 'r') as f:
-        for line in f:
-            if line.strip():
-                try:
-                    results.append(json.loads(line))
-                except:
-                    pass
+    with open(filepath, 'rb') as f:
+        lines = f.read().splitlines()
+    for line in lines:
+        if line.strip():
+            try:
+                results.append(_json_loads(line))
+            except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
+                pass
     return results
 
 def load_test_cases(cases_path: str) -> dict:
@@ -69,6 +87,8 @@ def load_test_cases(cases_path: str) -> dict:
 def grade_results(results: list, cases: dict) -> list:
     """Grade all results with both methods"""
     graded = []
+    responses = []
+    expected_lists = []
     
     for result in results:
         case_id = result.get('id')
@@ -80,19 +100,23 @@ def grade_results(results: list, cases: dict) -> list:
         expected = case.get('expected_keywords', [])
         negative = case.get('negative_keywords', [])
         
-        # Score with both methods
+        # Keyword score now; semantic scores are batched below
         kw_score = score_keyword(response, expected, negative)
-        sem_score = score_semantic(response, expected)
+        responses.append(response)
+        expected_lists.append(expected)
         
         graded.append({
             'id': case_id,
             'category': case.get('category', 'Unknown'),
             'input': case.get('input', '')[:50] + '...',
             'keyword_score': round(kw_score, 2),
-            'semantic_score': round(sem_score, 2),
+            'semantic_score': 0.0,
             'response_preview': response[:100] + '...' if len(response) > 100 else response
         })
     
+    for g, sem_score in zip(graded, score_semantic_batch(responses, expected_lists)):
+        g['semantic_score'] = round(sem_score, 2)
+    
     return graded
 
 def main():
@@ -4,14 +4,34 @@ import json
 import os
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add local directory to path to allow importing data/malaya_raw files
 sys.path.append(os.path.abspath("data/malaya_raw"))
 
+# Substring triggers per entity category, compiled once into a single
+# alternation each so every place is lowercased and scanned only once.
+ENTITY_CATEGORIES = {
+    "school": ("sekolah", "smk", "sk "),
+    "medical": ("hospital", "klinik", "pusat perubatan"),
+}
+ENTITY_PATTERNS = {
+    category: re.compile("|".join(map(re.escape, triggers)))
+    for category, triggers in ENTITY_CATEGORIES.items()
+}
+
 def save_json(data, folder, filename):
     path = os.path.join(folder, filename)
     os.makedirs(folder, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
     print(f"Saved {path} with {len(data) if isinstance(data, list) else len(data.keys())} entries")
 
 def extract_set_to_list(module, var_name):
@@ -20,6 +40,16 @@ def extract_set_to_list(module, var_name):
         return sorted(list(val))
     return []
 
+def categorize_places(all_places):
+    """Assign places to entity categories in a single pass."""
+    buckets = {category: [] for category in ENTITY_PATTERNS}
+    for place in all_places:
+        lowered = place.lower()
+        for category, pattern in ENTITY_PATTERNS.items():
+            if pattern.search(lowered):
+                buckets[category].append(place)
+    return buckets
+
 def main():
     print("Starting Massive Malaya Data Extraction...")
     
@@ -70,15 +100,14 @@ def main():
     print("Extracting Places & Entities...")
     all_places = []
     if hasattr(places, 'places'):
-        all_places = sorted(list(places.places))
+        all_places = sorted(places.places)
+        buckets = categorize_places(all_places)
         
         # Filter Schools
-        schools = [p for p in all_places if 'sekolah' in p.lower() or 'smk' in p.lower() or 'sk ' in p.lower()]
-        save_json({"entities": schools, "type": "school"}, "data/knowledge", "entities_schools.json")
+        save_json({"entities": buckets["school"], "type": "school"}, "data/knowledge", "entities_schools.json")
         
         # Filter Medical
-        medical = [p for p in all_places if 'hospital' in p.lower() or 'klinik' in p.lower() or 'pusat perubatan' in p.lower()]
-        save_json({"entities": medical, "type": "medical"}, "data/knowledge", "entities_medical.json")
+        save_json({"entities": buckets["medical"], "type": "medical"}, "data/knowledge", "entities_medical.json")
         
         # Save All Places
         save_json({"places": all_places}, "data/knowledge", "locations_malaysia.json")
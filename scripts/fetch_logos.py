@@ -1,7 +1,12 @@
-import urllib.request
-import base64
-import io
-import re
+import ast
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
 
 # Direct official logo sources (GitHub Avatars are usually high quality)
 LOGOS = {
@@ -33,62 +38,88 @@ LOGOS = {
     "gpt-3.5": "https://github.com/openai.png"
 }
 
-def fetch_and_encode(url):
+LOGO_DIR = Path("benchmark-tracker/static/logos")
+LOGO_URL_PREFIX = "/static/logos"
+# Same fallback the tracker server uses for unknown families
+DEFAULT_LOGO = f"{LOGO_URL_PREFIX}/opensource.png"
+MAX_WORKERS = 8
+HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+def make_session():
+    # One keep-alive session shared by all workers (connection + TLS reuse)
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+    return session
+
+def fetch_and_store(session, url):
+    """Download a logo into LOGO_DIR and return its static URL path."""
     try:
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urllib.request.urlopen(req) as response:
-            data = response.read()
-            # Basic check if it's an image
-            if not data: return ""
-            b64 = base64.b64encode(data).decode('utf-8')
-            # GitHub avatars are PNG usually.
-            return f"data:image/png;base64,{b64}"
+        response = session.get(url, timeout=10)
+        if response.status_code == 429:
+            # Back off briefly only when the host actually rate-limits us
+            time.sleep(0.05)
+            response = session.get(url, timeout=10)
+        response.raise_for_status()
+        data = response.content
+        # Basic check if it's an image
+        if not data: return DEFAULT_LOGO
+        # GitHub avatars are PNG usually. Content hash suffix busts browser caches.
+        stem = Path(urlparse(url).path).stem.lower()
+        name = f"{stem}-{hashlib.sha1(data).hexdigest()[:10]}.png"
+        LOGO_DIR.mkdir(parents=True, exist_ok=True)
+        (LOGO_DIR / name).write_bytes(data)
+        return f"{LOGO_URL_PREFIX}/{name}"
     except Exception as e:
         print(f"Failed {url}: {e}")
-        return ""
+        return DEFAULT_LOGO
 
-def generate_model_info():
-    model_info = {}
-    
-    # Map families to companies
-    companies = {
-        "qwen": "Alibaba",
-        "gemma": "Google",
-        "llama": "Meta",
-        "deepseek": "DeepSeek",
-        "mesolitica": "Mesolitica",
-        "llava": "LLaVA Team", 
-        "gpt-oss": "Open Source",
-        "openai": "OpenAI",
-        "gpt": "OpenAI"
-    }
+# Model-key prefix -> company, checked in order ("gpt-oss" must win over "gpt")
+FAMILY_PREFIXES = (
+    ("gpt-oss", "Open Source"),
+    ("qwen", "Alibaba"),
+    ("gemma", "Google"),
+    ("llama", "Meta"),
+    ("llava", "LLaVA Team"),
+    ("deepseek", "DeepSeek"),
+    ("mesolitica", "Mesolitica"),
+    ("openai", "OpenAI"),
+    ("gpt", "OpenAI"),
+)
+
+def company_for(key):
+    return next((company for prefix, company in FAMILY_PREFIXES if key.startswith(prefix)), "Unknown")
 
+def generate_model_info():
     # Generate dictionary
     print("Fetching logos...")
-    final_dict = {}
-    
-    # Cache processed URLs to avoid re-downloading
-    cache = {}
     
-    for key, url in LOGOS.items():
-        if url not in cache:
+    # Fetch each distinct URL once; many model keys share the same org avatar
+    unique_urls = list(dict.fromkeys(LOGOS.values()))
+    with make_session() as session, ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        for url in unique_urls:
             print(f"  Downloading {url}...")
-            cache[url] = fetch_and_encode(url)
-        
-        family_key = key.split('-')[0] if '-' in key and key != "gpt-oss" else key
-        if "qwen" in key: family_key = "qwen"
-        if "llama" in key: family_key = "llama"
-        if "gemma" in key: family_key = "gemma"
-        if "deepseek" in key: family_key = "deepseek"
-        
-        company = companies.get(family_key, companies.get(key, "Unknown"))
-        
-        final_dict[key] = {
-            "company": company,
-            "logo": cache[url]
-        }
-        
-    return final_dict
+        cache = dict(zip(unique_urls, pool.map(lambda u: fetch_and_store(session, u), unique_urls)))
+    
+    return {key: {"company": company_for(key), "logo": cache[url]} for key, url in LOGOS.items()}
+
+def replace_assignment(source, name, replacement):
+    """Splice `replacement` over the top-level `name = ...` statement.
+
+    The statement is located with ast so the rest of the file is kept
+    byte-for-byte. Returns None when no such assignment exists.
+    """
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == name for t in node.targets
+        ):
+            # ast offsets are UTF-8 byte columns, so splice on bytes
+            raw = source.encode("utf-8")
+            lines = raw.splitlines(keepends=True)
+            begin = sum(map(len, lines[:node.lineno - 1])) + node.col_offset
+            end = sum(map(len, lines[:node.end_lineno - 1])) + node.end_col_offset
+            return (raw[:begin] + replacement.encode("utf-8") + raw[end:]).decode("utf-8")
+    return None
 
 if __name__ == "__main__":
     new_info = generate_model_info()
@@ -97,27 +128,21 @@ if __name__ == "__main__":
     with open("benchmark-tracker/server.py", "r") as f:
         content = f.read()
     
-    # Find MODEL_INFO = { ... } and replace it
-    # We'll use a regex to match the block
-    import json
-    
     # Format the new dictionary as a python string
     # We want it pretty-printed to look like code
     dict_str = "MODEL_INFO = {\n"
     for k, v in new_info.items():
-        # Truncate base64 for display if debugging, but here we need full
         logo_part = f'"{v["logo"]}"'
         dict_str += f'    "{k}": {{"company": "{v["company"]}", "logo": {logo_part}}},\n'
     dict_str += "}"
     
-    # Regex replacement: match MODEL_INFO = \{.*?\} with dotall
-    pattern = r"MODEL_INFO = \{.*?\}"
-    
-    # Check if we can find it
-    if re.search(pattern, content, re.DOTALL):
-        new_content = re.sub(pattern, dict_str, content, flags=re.DOTALL)
+    # Replace the MODEL_INFO assignment node in place
+    new_content = replace_assignment(content, "MODEL_INFO", dict_str)
+    if new_content is None:
+        print("Could not find MODEL_INFO block in server.py")
+    elif new_content != content:
         with open("benchmark-tracker/server.py", "w") as f:
             f.write(new_content)
         print("Updated server.py with real logos!")
     else:
-        print("Could not find MODEL_INFO block in server.py")
+        print("server.py MODEL_INFO already up to date")
@@ -0,0 +1,21 @@
+import asyncio
+import os
+import sys
+
+# Sibling scripts are imported as modules; their own imports add the repo root
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import test_google_maps_mcp
+import test_youtube_transcript
+
+async def main():
+    print("🩺 Running Google Maps + YouTube MCP checks concurrently...")
+    # Each check owns its own MCPClientManager, so nothing is shared between them
+    # and total startup is bounded by the slowest server rather than the sum.
+    await asyncio.gather(
+        test_google_maps_mcp.main(),
+        test_youtube_transcript.main(),
+    )
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,58 @@
+"""
+Targeted notebook cell patching
+===============================
+Replaces the "source" array of selected cells in an .ipynb without
+round-tripping the whole notebook through json.load/json.dump: only the
+matched arrays are decoded and re-encoded, every other byte (including large
+output cells) is copied through untouched.
+
+Cells are located by an anchor substring of their source rather than by
+index, so patches keep working if cells are inserted above them.
+"""
+
+import json
+import re
+
+# A cell's "source" key; its indentation tells us the notebook's indent unit
+_SOURCE_RE = re.compile(r'^([ \t]*)"source":\s*\[', re.MULTILINE)
+_decoder = json.JSONDecoder()
+
+def _encode_source(lines, key_indent):
+    # "source" sits at depth 3 (notebook -> cells -> cell), so the indent
+    # unit is a third of its indentation; nested lines are shifted to match
+    unit = len(key_indent) // 3 or 1
+    encoded = json.dumps(lines, indent=unit)
+    return encoded.replace("\n", "\n" + key_indent)
+
+def patch_notebook_sources(notebook_path, replacements):
+    """
+    Replaces the source of every cell containing an anchor from
+    `replacements` ({anchor: new source lines}). The file is written only if
+    something changed. Returns the anchors that matched no cell.
+    """
+    with open(notebook_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    parts = []
+    pos = 0
+    missing = set(replacements)
+    for m in _SOURCE_RE.finditer(content):
+        start = m.end() - 1 # the opening '['
+        if start < pos: continue
+        lines, end = _decoder.raw_decode(content, start)
+        source = "".join(lines)
+        for anchor, new_lines in replacements.items():
+            if anchor in source:
+                missing.discard(anchor)
+                parts.append(content[pos:start])
+                parts.append(_encode_source(new_lines, m.group(1)))
+                pos = end
+                break
+
+    if pos:
+        parts.append(content[pos:])
+        new_content = "".join(parts)
+        if new_content != content:
+            with open(notebook_path, 'w', encoding='utf-8') as f:
+                f.write(new_content)
+    return missing
@@ -11,40 +11,91 @@ Output: reports/grading_docket.md
 import json
 import glob
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Timestamp token of a V3 log name (the part split('_')[2] used to pick out)
+_V3_RE = re.compile(r'^v3_benchmark_([^_]+)')
+
 def load_test_cases(filepath):
-    with open(filepath, 'r') as f:
-        cases = json.load(f)
     # Ensure it's a dict keyed by ID
-    return {str(c['id']): c for c in cases}
+    cases = {str(c['id']): c for c in _json_loads(Path(filepath).read_bytes())}
+    # Lowercase + UTF-8 encode keywords/reference once here rather than on
+    # every lookup (UTF-8 byte containment matches str containment)
+    for c in cases.values():
+        c['_kw_lower'] = tuple(k.lower().encode('utf-8') for k in c.get('expected_keywords', []))
+        c['_ref_lower'] = (c.get('reference_answer') or '').lower().encode('utf-8')
+    return cases
 
 def reference_alignment_flag(case):
-    reference = case.get("reference_answer", "") or ""
-    expected = [k.lower() for k in case.get("expected_keywords", [])]
-    ref_lower = reference.lower()
+    # Cases not built by load_test_cases lack the precomputed keys
+    expected = case.get('_kw_lower')
+    if expected is None:
+        expected = tuple(k.lower().encode('utf-8') for k in case.get('expected_keywords', []))
     if not expected:
         return False
-    return any(k in ref_lower for k in expected)
+    ref = case.get('_ref_lower')
+    if ref is None:
+        ref = (case.get('reference_answer') or '').lower().encode('utf-8')
+    find = ref.find
+    return any(find(k) >= 0 for k in expected)
+
+def iter_jsonl_records(f, chunk_size=1 << 20):
+    """Yield non-blank lines from a binary file, reading it in large blocks."""
+    tail = b''
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        data = tail + chunk if tail else chunk
+        start = 0
+        idx = data.find(b'\n', start)
+        while idx != -1:
+            if idx > start and not data[start:idx].isspace():
+                yield data[start:idx]
+            start = idx + 1
+            idx = data.find(b'\n', start)
+        tail = data[start:]
+    if tail and not tail.isspace():
+        yield tail
 
 def load_log_file(filepath):
     results = {}
     try:
-        with open(filepath, 'r') as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        data = json.loads(line)
-                        if 'id' in data:
-                            results[str(data['id'])] = data.get('output', '') or data.get('response', '')
-                        elif 'grading' in data: # V3 format
-                             results[str(data['id'])] = data.get('response', '')
-                    except:
-                        pass
+        with open(filepath, 'rb') as f:
+            for line in iter_jsonl_records(f):
+                try:
+                    data = _json_loads(line)
+                    if 'id' in data:
+                        results[str(data['id'])] = data.get('output', '') or data.get('response', '')
+                    elif 'grading' in data: # V3 format
+                         results[str(data['id'])] = data.get('response', '')
+                except:
+                    pass
     except Exception as e:
         print(f"Error reading {filepath}: {e}")
     return results
 
+def load_v3_log(filepath):
+    """Load a V3 JSON log; returns None if the file can't be parsed."""
+    try:
+        with open(filepath, 'rb') as f:
+            data = _json_loads(f.read())
+        results = {}
+        if 'results' in data:
+            for r in data['results']:
+                results[str(r['id'])] = r.get('response', '')
+        return results
+    except:
+        return None
+
 def main():
     root_dir = Path(__file__).parent.parent
     reports_dir = root_dir / "reports"
@@ -65,69 +116,72 @@ def main():
     
     model_data = {}
 
+    # Process V3 Logs (Usually JSON, not JSONL, but let's check extension)
+    v3_logs = [log_file for log_file in v3_logs if "graded" not in log_file]
+
+    # Parsing is CPU-bound and independent per file, so fan it out across cores
+    with ProcessPoolExecutor() as executor:
+        competitor_results = list(executor.map(load_log_file, log_files))
+        v3_results = list(executor.map(load_v3_log, v3_logs))
+
     # Process Competitor Logs
-    for log_file in log_files:
+    for log_file, results in zip(log_files, competitor_results):
         model_name = os.path.basename(log_file).replace("benchmark_competitor_", "").replace(".jsonl", "")
-        results = load_log_file(log_file)
         model_data[model_name] = results
 
-    # Process V3 Logs (Usually JSON, not JSONL, but let's check extension)
-    for log_file in v3_logs:
-        if "graded" in log_file: continue
-        model_name = "Malaya_V3_" + os.path.basename(log_file).split('_')[2] # timestamp
-        try:
-             with open(log_file, 'r') as f:
-                data = json.load(f)
-                results = {}
-                if 'results' in data:
-                    for r in data['results']:
-                        results[str(r['id'])] = r.get('response', '')
-                model_data[model_name] = results
-        except:
-            pass
-
-    # Generate Markdown Docket
-    with open(output_path, 'w') as f:
-        f.write("# Agent Grading Docket\n\n")
-        f.write("> Instructions: Use Expected Keywords + intent as primary signal. Reference Answer may be misaligned.\n")
-        f.write("> Rate 0-10 for understanding and helpfulness.\n\n")
-        
-        # Summary Table
-        f.write("## 1. Completion Summary\n\n")
-        f.write("| Model | Completed Cases | % |\n")
-        f.write("| :--- | :--- | :--- |\n")
-        for model in sorted(model_data.keys()):
-            count = len(model_data[model])
-            pct = round((count / total_cases) * 100, 1)
-            f.write(f"| {model} | {count}/{total_cases} | {pct}% |\n")
+    for log_file, results in zip(v3_logs, v3_results):
+        if results is None: continue
+        m = _V3_RE.match(os.path.basename(log_file))
+        model_name = f"Malaya_V3_{m.group(1) if m else 'unknown'}"
+        model_data[model_name] = results
+
+    # Model order is the same for every table; sort it once
+    sorted_models = sorted(model_data.keys())
+
+    # Generate Markdown Docket (built in memory, written out in one call)
+    parts = []
+    parts.append("# Agent Grading Docket\n\n")
+    parts.append("> Instructions: Use Expected Keywords + intent as primary signal. Reference Answer may be misaligned.\n")
+    parts.append("> Rate 0-10 for understanding and helpfulness.\n\n")
+    
+    # Summary Table
+    parts.append("## 1. Completion Summary\n\n")
+    parts.append("| Model | Completed Cases | % |\n")
+    parts.append("| :--- | :--- | :--- |\n")
+    for model in sorted_models:
+        count = len(model_data[model])
+        pct = round((count / total_cases) * 100, 1)
+        parts.append(f"| {model} | {count}/{total_cases} | {pct}% |\n")
+    
+    parts.append("\n---\n\n")
+    parts.append("## 2. Test Case Deep Dive (Sample 5 Difficult Cases)\n\n")
+    
+    # Select 5 specific difficult cases (Shortforms, Dialects)
+    target_ids = ['1', '8', '14', '32', '38'] 
+    
+    for case_id in target_ids:
+        if case_id not in cases: continue
+        case = cases[case_id]
+        parts.append(f"### Case {case_id}: {case['category']}\n")
+        parts.append(f"**Input:** `{case['input']}`\n")
+        parts.append(f"**Expected Keywords:** `{', '.join(case.get('expected_keywords', []))}`\n")
+        reference = case.get('reference_answer', '')
+        aligned = reference_alignment_flag(case)
+        if aligned:
+            parts.append(f"**Reference:** `{reference}`\n\n")
+        else:
+            parts.append(f"**Reference (Unaligned):** `{reference}`\n\n")
         
-        f.write("\n---\n\n")
-        f.write("## 2. Test Case Deep Dive (Sample 5 Difficult Cases)\n\n")
+        parts.append("| Model | Response | Score (Agent) |\n")
+        parts.append("| :--- | :--- | :--- |\n")
         
-        # Select 5 specific difficult cases (Shortforms, Dialects)
-        target_ids = ['1', '8', '14', '32', '38'] 
+        for model in sorted_models:
+            response = model_data[model].get(case_id, "MISSING").replace("\n", " ")
+            parts.append(f"| **{model}** | {response[:150]}... | |\n")
         
-        for case_id in target_ids:
-            if case_id not in cases: continue
-            case = cases[case_id]
-            f.write(f"### Case {case_id}: {case['category']}\n")
-            f.write(f"**Input:** `{case['input']}`\n")
-            f.write(f"**Expected Keywords:** `{', '.join(case.get('expected_keywords', []))}`\n")
-            reference = case.get('reference_answer', '')
-            aligned = reference_alignment_flag(case)
-            if aligned:
-                f.write(f"**Reference:** `{reference}`\n\n")
-            else:
-                f.write(f"**Reference (Unaligned):** `{reference}`\n\n")
-            
-            f.write("| Model | Response | Score (Agent) |\n")
-            f.write("| :--- | :--- | :--- |\n")
-            
-            for model in sorted(model_data.keys()):
-                response = model_data[model].get(case_id, "MISSING").replace("\n", " ")
-                f.write(f"| **{model}** | {response[:150]}... | |\n")
-            
-            f.write("\n")
+        parts.append("\n")
+
+    output_path.write_text(''.join(parts), encoding='utf-8')
 
     print(f"Docket generated at {output_path}")
 
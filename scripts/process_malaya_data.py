@@ -3,6 +3,11 @@ import sys
 import json
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add local directory to path to allow importing data/malaya_raw files
 sys.path.append(os.path.abspath("data/malaya_raw"))
 
@@ -15,8 +20,12 @@ except ImportError as e:
 
 def save_json(data, filename):
     path = os.path.join("data/dictionaries", filename)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
     print(f"Saved {path}")
 
 def main():
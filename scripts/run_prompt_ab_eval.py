@@ -4,8 +4,19 @@ import json
 import sys
 from pathlib import Path
 
+import numpy as np
 import yaml
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT))
 
@@ -40,16 +51,53 @@ def load_variants(config_path: Path, variants_path: Path):
     return resolved
 
 
-def score_case(response: str, expected_keywords):
+def compile_keywords(expected_keywords):
+    """Build a matcher returning the keywords present in a lowercased text.
+
+    With pyahocorasick installed all keywords are found in one pass over the
+    text; otherwise the keyword array is searched in a single vectorized
+    np.char.find call instead of a Python-level loop.
+    """
+    # Pair each keyword with its lowercase form once, not on every answer
+    keywords = list(expected_keywords)
+    lowered = [kw.lower() for kw in keywords]
+    if not keywords:
+        return lambda text: []
+    if ahocorasick is None:
+        lowered_array = np.array(lowered, dtype=str)
+
+        def match_vectorized(text):
+            mask = np.char.find(text, lowered_array) >= 0
+            return [kw for kw, hit in zip(keywords, mask) if hit]
+
+        return match_vectorized
+    automaton = ahocorasick.Automaton()
+    for kw_lower in lowered:
+        automaton.add_word(kw_lower, kw_lower)
+    automaton.make_automaton()
+
+    def match(text):
+        found = {value for _, value in automaton.iter(text)}
+        return [kw for kw, kw_lower in zip(keywords, lowered) if kw_lower in found]
+
+    return match
+
+
+DEFAULT_CONCURRENCY = 4
+
+
+def score_case(response: str, expected_keywords, matcher=None):
     if not response:
         return 0, []
-    response_lower = response.lower()
-    hits = [kw for kw in expected_keywords if kw.lower() in response_lower]
+    matcher = matcher or compile_keywords(expected_keywords)
+    hits = matcher(response.lower())
     return len(hits), hits
 
 
-async def run_eval(variants, cases):
+async def run_eval(variants, cases, max_concurrency=DEFAULT_CONCURRENCY):
     results = []
+    # Keyword sets are per case, so compile them once and reuse across variants
+    matchers = [compile_keywords(case.get("expected_keywords", [])) for case in cases]
     for variant in variants:
         bot = MalayaChatbot()
         if not bot.llm:
@@ -57,11 +105,19 @@ async def run_eval(variants, cases):
                 "error": f"LLM unavailable: {bot.llm_error or 'not configured'}"
             }
         bot.config["system_prompts"]["chatbot"] = variant["prompt"]
+        # Queries are independent and latency-bound, so run them concurrently
+        # with a cap on in-flight LLM requests
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def ask(query):
+            async with semaphore:
+                return await bot.process_query(query)
+
+        responses = await asyncio.gather(*(ask(case["query"]) for case in cases))
         variant_scores = []
-        for case in cases:
-            response = await bot.process_query(case["query"])
+        for case, matcher, response in zip(cases, matchers, responses):
             answer = response.get("answer", "")
-            score, hits = score_case(answer, case.get("expected_keywords", []))
+            score, hits = score_case(answer, case.get("expected_keywords", []), matcher)
             variant_scores.append({
                 "id": case.get("id"),
                 "query": case.get("query"),
@@ -85,7 +141,10 @@ def write_reports(output_dir: Path, payload: dict):
     json_path = output_dir / "prompt_ab_eval.json"
     md_path = output_dir / "prompt_ab_eval.md"
 
-    json_path.write_text(json.dumps(payload, indent=2, ensure_ascii=True), encoding="utf-8")
+    if orjson is not None:
+        json_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        json_path.write_text(json.dumps(payload, indent=2, ensure_ascii=True), encoding="utf-8")
 
     if "error" in payload:
         md_path.write_text(f"# Prompt A/B Eval\n\nError: {payload['error']}\n", encoding="utf-8")
@@ -111,6 +170,7 @@ def main():
     parser.add_argument("--variants", default="docs/prompt_variants.yaml")
     parser.add_argument("--cases", default="tests/fixtures/prompt_ab_cases.jsonl")
     parser.add_argument("--output", default="reports")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
     args = parser.parse_args()
 
     config_path = Path(args.config)
@@ -120,7 +180,7 @@ def main():
     variants = load_variants(config_path, variants_path)
     cases = load_cases(cases_path)
 
-    payload = asyncio.run(run_eval(variants, cases))
+    payload = asyncio.run(run_eval(variants, cases, max(args.concurrency, 1)))
     write_reports(Path(args.output), payload)
 
 
@@ -13,250 +13,430 @@ It handles:
 """
 
 import json
-import glob
+import mmap
 import re
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+# Expected keywords are looked for in this many leading characters first;
+# the rest of a long response is scanned only if the head can't settle it
+MAX_SCAN_CHARS = 2048
+
+def load_json_file(path):
+    """
+    Parses a JSON log. With orjson the file is mapped and parsed in place,
+    skipping the intermediate bytes copy for the large V6 logs.
+    """
+    with open(path, 'rb') as f:
+        if orjson is None or os.fstat(f.fileno()).st_size == 0:
+            return json.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+def build_keyword_index(keywords):
+    """
+    Compiles a case's lowercased keywords for matching. With pyahocorasick
+    this is one automaton, so a single linear pass over the response finds
+    every hit; otherwise a NumPy string array searched by one vectorized
+    np.char.find call. Returns None when there is nothing to match.
+    """
+    if not keywords:
+        return None
+    if ahocorasick is None:
+        return np.array(keywords, dtype=str)
+    automaton = ahocorasick.Automaton()
+    for k in keywords:
+        automaton.add_word(k, k)
+    automaton.make_automaton()
+    return automaton
+
+def case_keyword_hits(index, keywords, response_lower):
+    """Returns the keywords found in response_lower, through the case's prebuilt index."""
+    if index is None:
+        return []
+    if isinstance(index, np.ndarray):
+        mask = np.char.find(response_lower, index) >= 0
+        return [k for k, hit in zip(keywords, mask) if hit]
+    found = {k for _, k in index.iter(response_lower)}
+    return [k for k in keywords if k in found]
+
+def case_has_negative(index, response_lower):
+    if index is None:
+        return False
+    if isinstance(index, np.ndarray):
+        return bool((np.char.find(response_lower, index) >= 0).any())
+    return next(index.iter(response_lower), None) is not None
+
 # --- Grading Logic Overrides ---
+# Substrings each hand-graded case looks for, grouped by what a hit means
+OVERRIDE_TERMS = {
+    # 1. Shortforms: "xleh la bro" -> Refusal / Can't
+    '1': {
+        'refusal': ('tak boleh', 'cannot', 'x boleh', 'tak dapat', 'no money'),
+        'acceptance': ('tiada masalah', 'no problem', 'ok'),
+    },
+    # 32. Facts: Prime Minister (STRICT)
+    '32': {
+        'anwar': ('anwar',),
+        'outdated': ('ismail sabri', 'muhyiddin'),
+    },
+    # 8. Kelantan: "demo tokene" -> "mu tak makan lagi?" (RELAXED)
+    '8': {
+        'eat': ('makan', 'eat'),
+        'dish': ('nasi', 'kerabu'),
+        'misread': ('demonstration', 'token'),
+        'makan': ('makan',),
+    },
+    # 38. Translation: I Love You (Kelantan) -> Kawe/Ambo/Kito (RELAXED)
+    '38': {
+        'dialect': ('kawe', 'ambo', 'kito'),
+        'sayang': ('sayang',),
+        'standard': ('saya sayang', 'aku sayang', 'cinta'),
+    },
+}
+
+def _compile_override_databases():
+    """
+    One Hyperscan database per overridden case holding all of its terms, so
+    a single scan of the response reports every matching group. Returns {}
+    when hyperscan isn't installed (the plain substring checks are used).
+    """
+    if hyperscan is None:
+        return {}
+    databases = {}
+    for case_id, groups in OVERRIDE_TERMS.items():
+        names = list(groups)
+        expressions, ids = [], []
+        for group_id, name in enumerate(names):
+            for term in groups[name]:
+                expressions.append(re.escape(term).encode('utf-8'))
+                ids.append(group_id)
+        db = hyperscan.Database()
+        db.compile(
+            expressions=expressions,
+            ids=ids,
+            elements=len(expressions),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions),
+        )
+        databases[case_id] = (db, names)
+    return databases
+
+_OVERRIDE_DBS = _compile_override_databases()
+
+def override_groups(case_id, response_lower):
+    """Names of the OVERRIDE_TERMS groups of case_id present in the response."""
+    compiled = _OVERRIDE_DBS.get(case_id)
+    if compiled is None:
+        return {name for name, terms in OVERRIDE_TERMS[case_id].items()
+                if any(x in response_lower for x in terms)}
+    db, names = compiled
+    found = set()
+    def on_match(group_id, start, end, flags, context):
+        found.add(names[group_id])
+    db.scan(response_lower.encode('utf-8'), match_event_handler=on_match)
+    return found
+
 def grade_case_logic(case_id, response_lower, response_text):
     """
     Returns (score, feedback). Score 0.0 to 1.0.
     """
+    if case_id not in OVERRIDE_TERMS:
+        # Default: Enhanced Keyword Match
+        return -1, "Use Default"
+    found = override_groups(case_id, response_lower)
     
-    # 1. Shortforms: "xleh la bro" -> Refusal / Can't
     if case_id == '1':
-        if any(x in response_lower for x in ['tak boleh', 'cannot', 'x boleh', 'tak dapat', 'no money']):
+        if 'refusal' in found:
             return 1.0, "Correct refusal"
-        if any(x in response_lower for x in ['tiada masalah', 'no problem', 'ok']):
+        if 'acceptance' in found:
             return 0.0, "Incorrect acceptance"
         return 0.5, "Ambiguous"
 
-    # 32. Facts: Prime Minister (STRICT)
     if case_id == '32':
-        if 'anwar' in response_lower:
+        if 'anwar' in found:
             return 1.0, "Correct (Anwar)"
-        if 'ismail sabri' in response_lower or 'muhyiddin' in response_lower:
+        if 'outdated' in found:
             return 0.0, "Outdated (Sabri/Muhyiddin)"
         return 0.0, "Incorrect"
 
-    # 8. Kelantan: "demo tokene" -> "mu tak makan lagi?" (RELAXED)
     if case_id == '8':
         # Prompt: "demo tokene make nasi kerabu lagi ko?"
         # Standard Malay: "awak tak makan nasi kerabu lagi ke?"
         
         # 1. Did it understand the TOPIC (eating / nasi kerabu)?
-        topic_match = ('makan' in response_lower or 'eat' in response_lower) and \
-                      ('nasi' in response_lower or 'kerabu' in response_lower)
-        
-        if topic_match:
+        if 'eat' in found and 'dish' in found:
              return 1.0, "Understood dialect input"
         
-        if 'demonstration' in response_lower or 'token' in response_lower:
+        if 'misread' in found:
             return 0.0, "Misinterpreted 'demo/token'"
         
         # Fallback partial credit if just 'makan' is found
-        if 'makan' in response_lower:
+        if 'makan' in found:
             return 0.5, "Partial understanding"
             
         return 0.0, "Failed"
 
-    # 38. Translation: I Love You (Kelantan) -> Kawe/Ambo/Kito (RELAXED)
-    if case_id == '38':
-        # Authentic Dialect
-        if any(x in response_lower for x in ['kawe', 'ambo', 'kito']) and 'sayang' in response_lower:
-            return 1.0, "Authentic Kelantan"
-        
-        # Standard Malay Acceptance (User Request: Loose Dialect)
-        # "Saya sayang awak" or "Aku cinta kamu" is now ACCEPTABLE because it understood the requested meaning
-        if 'saya sayang' in response_lower or 'aku sayang' in response_lower or 'cinta' in response_lower:
-            return 1.0, "Correct Meaning (Standard Malay Accepted)"
-            
-        return 0.0, "Failed"
+    # case 38
+    # Authentic Dialect
+    if 'dialect' in found and 'sayang' in found:
+        return 1.0, "Authentic Kelantan"
+    
+    # Standard Malay Acceptance (User Request: Loose Dialect)
+    # "Saya sayang awak" or "Aku cinta kamu" is now ACCEPTABLE because it understood the requested meaning
+    if 'standard' in found:
+        return 1.0, "Correct Meaning (Standard Malay Accepted)"
         
-    # Default: Enhanced Keyword Match
-    return -1, "Use Default"
+    return 0.0, "Failed"
 
 def load_case_keywords(cases_path):
     with open(cases_path, 'r') as f:
         cases = json.load(f)
-    return {str(c['id']): c for c in cases}
+    cases = {str(c['id']): c for c in cases}
+    # Lowercased keywords and per-case keyword indexes for the default
+    # keyword fallback, computed once here instead of for every response
+    for c in cases.values():
+        c['_expected_lower'] = tuple(k.lower() for k in c.get('expected_keywords', []))
+        c['_negative_lower'] = tuple(k.lower() for k in c.get('negative_keywords', []))
+        c['_expected_len'] = len(c['_expected_lower'])
+        c['_expected_index'] = build_keyword_index(c['_expected_lower'])
+        c['_negative_index'] = build_keyword_index(c['_negative_lower'])
+    return cases
+
+def fallback_scores(negative, hits, expected_len, response_len):
+    """
+    Keyword-saturation scores for a batch of responses, given per-response
+    stat arrays. One vectorized select replaces a Python branch ladder per
+    response.
+    """
+    return np.select(
+        [
+            negative, # Negative penalty
+            hits >= 2, # 2+ keywords: assume full intent coverage (Synonym list handling)
+            (hits == 1) & (expected_len <= 2), # If only 1-2 keywords expected, 1 hit is perfect
+            hits == 1, # Good partial credit
+            response_len > 10, # No keywords matched: tiny effort score
+        ],
+        [0.0, 1.0, 1.0, 0.8, 0.1],
+        default=0.0,
+    )
+
+def _response_stats(case_id, case, response):
+    """
+    Returns the override score for hand-graded cases, otherwise the
+    (negative, hits, expected_len, response_len) stats fallback_scores needs.
+    """
+    response_lower = response.lower()
+    
+    # 1. Check Specific Logic first
+    score, reason = grade_case_logic(case_id, response_lower, response)
+    if score != -1:
+        return score
+    
+    # 2. Fallback to Enhanced Keyword Match
+    if case_has_negative(case['_negative_index'], response_lower):
+        return True, 0, case['_expected_len'], len(response)
+    # 2+ hits in the head already decide the score; only fewer need the full text
+    hits = len(case_keyword_hits(case['_expected_index'], case['_expected_lower'], response_lower[:MAX_SCAN_CHARS]))
+    if hits < 2 and len(response_lower) > MAX_SCAN_CHARS:
+        hits = len(case_keyword_hits(case['_expected_index'], case['_expected_lower'], response_lower))
+    return False, hits, case['_expected_len'], len(response)
 
 def grade_submission(results, cases):
+    """
+    Mean score (0.0 to 1.0) of a submission. The V3-V6 logs replay many
+    identical outputs, so scores are memoized per case on the raw response;
+    only unseen responses are scanned, and their keyword-fallback scores are
+    computed together in one fallback_scores() call.
+    """
     scores = []
+    pending = [] # (index in scores, case cache, response, stats)
     
     for case_id, response in results.items():
-        if case_id not in cases: continue
-        
-        case = cases[case_id]
-        response_lower = response.lower()
-        
-        # 1. Check Specific Logic first
-        score, reason = grade_case_logic(case_id, response_lower, response)
-        
-        # 2. Fallback to Enhanced Keyword Match
-        if score == -1:
-            expected = [k.lower() for k in case.get('expected_keywords', [])]
-            negative = [k.lower() for k in case.get('negative_keywords', [])]
-            
-            # Negative penalty
-            if any(n in response_lower for n in negative):
-                score = 0.0
+        case = cases.get(case_id)
+        if case is None: continue
+        cache = case.setdefault('_score_cache', {})
+        score = cache.get(response)
+        if score is None:
+            outcome = _response_stats(case_id, case, response)
+            if isinstance(outcome, tuple):
+                pending.append((len(scores), cache, response, outcome))
+                score = 0.0 # filled in below
             else:
-                # Positives (Keyword Saturation)
-                hits = sum(1 for k in expected if k in response_lower)
-                
-                if hits >= 2:
-                    # If 2 or more keywords found, assume full intent coverage (Synonym list handling)
-                    score = 1.0
-                elif hits == 1:
-                    # Single keyword match
-                    if len(expected) <= 2:
-                        score = 1.0 # If only 1-2 keywords expected, 1 hit is perfect
-                    else:
-                        score = 0.8 # Good partial credit
-                else:
-                    # No keywords matched
-                    score = 0.0
-                    if len(response) > 10: score = 0.1 # Tiny effort score
-        
+                score = cache[response] = outcome
         scores.append(score)
+    
+    if pending:
+        stats = [np.array(column) for column in zip(*(p[3] for p in pending))]
+        for (i, cache, response, _), score in zip(pending, fallback_scores(*stats).tolist()):
+            scores[i] = cache[response] = score
         
     if not scores: return 0.0
     return sum(scores) / len(scores)
 
+def jsonl_model_name(filename):
+    return filename.replace("benchmark_competitor_", "").replace(".jsonl", "")
+
+def v3_model_name(filename):
+    # Extract meaningful name
+    if "with_gate" in filename: return "Malaya V3 (Gate)"
+    return "Malaya V3 w/ " + filename.split('_')[0]
+
+def not_graded(filename):
+    return "graded" not in filename
+
+# One entry per log family, in report order: (kind, model namer, filename filter)
+SPECS = [
+    ("jsonl", jsonl_model_name, None),
+    # V3 format logs
+    ("v3", v3_model_name, not_graded),
+    ("v4", lambda _: "Malaya V4 (Agnt)", None), # Short for Agentic
+    ("v5", lambda _: "Malaya V5 (Agnt)", None), # Agentic + Web
+    ("v6", lambda _: "Malaya V6 (Full)", None), # V6 with RAG + Web + SFT Model
+]
+
+# Filename prefixes of the JSON logs under reports/v3_benchmark
+_JSON_PREFIXES = (
+    ("v3_benchmark_", "v3"),
+    ("v4_benchmark_", "v4"),
+    ("v5_benchmark_", "v5"),
+    ("v6_full_benchmark_", "v6"),
+)
+
+def _classify(name):
+    """Returns the SPECS kind of a report filename, or None if it isn't a log."""
+    if name.startswith('.'):
+        return None
+    if name.endswith(".jsonl"):
+        return "jsonl"
+    if name.endswith(".json"):
+        for prefix, kind in _JSON_PREFIXES:
+            if name.startswith(prefix):
+                return kind
+    return None
+
+def scan_logs(reports_dir):
+    """
+    Buckets log DirEntry objects by kind with one os.scandir pass over reports/ (JSONL
+    competitor logs) and one over reports/v3_benchmark (V3-V6 JSON logs).
+    """
+    buckets = {kind: [] for kind, _, _ in SPECS}
+    for directory, want_jsonl in ((reports_dir, True), (reports_dir / "v3_benchmark", False)):
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    kind = _classify(entry.name)
+                    if kind is None or (kind == "jsonl") != want_jsonl: continue
+                    if entry.is_file(): buckets[kind].append(entry)
+        except FileNotFoundError:
+            continue
+    return buckets
+
+def load_log_results(log_path):
+    """
+    Returns {case_id: response} for a JSONL competitor log or a V3-V6 JSON
+    log, or None when a JSON log can't be parsed.
+    """
+    results = {}
+    if log_path.endswith(".jsonl"):
+        with open(log_path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        d = _json_loads(line)
+                    except json.JSONDecodeError: continue
+                    if 'id' in d: results[str(d['id'])] = d.get('output', '') or d.get('response', '')
+        return results
+    try:
+        d = load_json_file(log_path)
+    except json.JSONDecodeError:
+        return None
+    if 'results' in d:
+        for r in d['results']:
+            results[str(r['id'])] = r.get('response', '')
+    return results
+
+def ingest(log_path, cases):
+    """Loads and grades one log; returns (score, completed) or None if unreadable."""
+    results = load_log_results(log_path)
+    if results is None:
+        return None
+    return grade_submission(results, cases), len(results)
+
+# Cases as loaded in a pool worker; set once per process by _init_worker
+_worker_cases = None
+
+def _init_worker(cases_path):
+    # Each worker builds its own case keyword indexes once, instead of having
+    # them pickled along with every task; score caches then persist per worker
+    global _worker_cases
+    _worker_cases = load_case_keywords(cases_path)
+
+def grade_one(log_path):
+    return ingest(log_path, _worker_cases)
+
 def main():
     root_dir = Path(__file__).parent.parent
     reports_dir = root_dir / "reports"
-    cases = load_case_keywords(root_dir / "tests/fixtures/expanded_cases.json")
+    cases_path = root_dir / "tests/fixtures/expanded_cases.json"
+    cases = load_case_keywords(cases_path)
     
-    log_files = glob.glob(str(reports_dir / "*.jsonl")) + glob.glob(str(reports_dir / "benchmark_competitor_*.jsonl"))
-    # Add V3 format logs
-    v3_logs = glob.glob(str(reports_dir / "v3_benchmark/v3_benchmark_*.json"))
-    # Add V4 logs
-    v4_logs = glob.glob(str(reports_dir / "v3_benchmark/v4_benchmark_*.json"))
-    # Add V5 logs
-    v5_logs = glob.glob(str(reports_dir / "v3_benchmark/v5_benchmark_*.json"))
-    # Add V6 logs
-    v6_logs = glob.glob(str(reports_dir / "v3_benchmark/v6_full_benchmark_*.json"))
-    
-    final_results = []
-    
-    # Process Standard JSONL
+    logs = scan_logs(reports_dir)
+    inputs = []
     seen_models = set()
+    for kind, namer, keep in SPECS:
+        for entry in logs[kind]:
+            if keep and not keep(entry.name): continue
+            model = namer(entry.name)
+            if kind == "jsonl":
+                # scan_logs lists each file once, so this only catches two files
+                # naming the same competitor (x.jsonl and benchmark_competitor_x.jsonl)
+                if model in seen_models: continue
+                seen_models.add(model)
+            inputs.append((entry.path, model))
     
-    for log_path in log_files:
-        model = os.path.basename(log_path).replace("benchmark_competitor_", "").replace(".jsonl", "")
-        if model in seen_models: continue
-        seen_models.add(model)
-        
-        results = {}
-        try:
-            with open(log_path, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            d = json.loads(line)
-                            if 'id' in d: results[str(d['id'])] = d.get('output', '') or d.get('response', '')
-                        except: pass
-        except: continue
-        
-        final_score = grade_submission(results, cases)
-        final_results.append({
-            "model": model, 
-            "score": round(final_score * 100, 1),
-            "completed": len(results)
-        })
-
-    # Process V3
-    for log_path in v3_logs:
-        if "graded" in log_path: continue
-        filename = os.path.basename(log_path)
-        # Extract meaningful name
-        if "with_gate" in filename: model = "Malaya V3 (Gate)"
-        else: model = "Malaya V3 w/ " + filename.split('_')[0]
-        
-        results = {}
-        try:
-            with open(log_path, 'r') as f:
-                d = json.load(f)
-                if 'results' in d:
-                    for r in d['results']:
-                        results[str(r['id'])] = r.get('response', '')
-        except: continue
-        
-        final_score = grade_submission(results, cases)
-        final_results.append({
-            "model": model,
-            "score": round(final_score * 100, 1),
-            "completed": len(results)
-        })
-
-    # Process V4
-    for log_path in v4_logs:
-        filename = os.path.basename(log_path)
-        model = "Malaya V4 (Agnt)" # Short for Agentic
-        
-        results = {}
-        try:
-            with open(log_path, 'r') as f:
-                d = json.load(f)
-                if 'results' in d:
-                    for r in d['results']:
-                        results[str(r['id'])] = r.get('response', '')
-        except: continue
-        
-        final_score = grade_submission(results, cases)
-        final_results.append({
-            "model": model,
-            "score": round(final_score * 100, 1),
-            "completed": len(results)
-        })
-
-    # Process V5
-    for log_path in v5_logs:
-        filename = os.path.basename(log_path)
-        model = "Malaya V5 (Agnt)" # Agentic + Web
-        
-        results = {}
-        try:
-            with open(log_path, 'r') as f:
-                d = json.load(f)
-                if 'results' in d:
-                    for r in d['results']:
-                        results[str(r['id'])] = r.get('response', '')
-                elif 'results' not in d and isinstance(d, dict): # Handle V5 new format if needed, but it uses "results" list
-                     pass
-        except: continue
-        
-        final_score = grade_submission(results, cases)
-        final_results.append({
-            "model": model,
-            "score": round(final_score * 100, 1),
-            "completed": len(results)
-        })
-
-    # Process V6
-    for log_path in v6_logs:
-        filename = os.path.basename(log_path)
-        model = "Malaya V6 (Full)" # V6 with RAG + Web + SFT Model
-        
-        results = {}
-        try:
-            with open(log_path, 'r') as f:
-                d = json.load(f)
-                if 'results' in d:
-                    for r in d['results']:
-                        results[str(r['id'])] = r.get('response', '')
-        except: continue
-        
-        final_score = grade_submission(results, cases)
+    # Parsing + grading is independent per file, so spread it across cores
+    paths = [log_path for log_path, _ in inputs]
+    graded = []
+    if paths:
+        workers = min(os.cpu_count() or 1, len(paths))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cases_path,)) as executor:
+            graded = list(executor.map(grade_one, paths))
+    
+    final_results = []
+    for (log_path, model), outcome in zip(inputs, graded):
+        if outcome is None: continue
+        final_score, completed = outcome
         final_results.append({
             "model": model,
             "score": round(final_score * 100, 1),
-            "completed": len(results)
+            "completed": completed
         })
     
+    v4_logs = [entry.path for entry in logs["v4"]]
+    v5_logs = [entry.path for entry in logs["v5"]]
+    
     # Print Table
     print(f"| Model | Score (Agent Proxy) | Cases |")
     print(f"| :--- | :--- | :--- |")
@@ -270,26 +450,31 @@ def main():
     elif v4_logs: target_log = v4_logs[-1]
     
     if target_log:
-        with open(target_log, 'r') as f:
-            d = json.load(f)
-            # Handle V5 list format vs V4 list format (both use "results")
-            if 'results' in d:
-                results = {str(r['id']): r.get('response', '') for r in d['results']}
-            else:
-                results = {}
+        d = load_json_file(target_log)
+        # Handle V5 list format vs V4 list format (both use "results")
+        if 'results' in d:
+            results = {str(r['id']): r.get('response', '') for r in d['results']}
+        else:
+            results = {}
             
         for cid, case in cases.items():
             if cid in results:
                 response = results[cid]
+                rl = response.lower()
                 
-                # Check for negative keywords
-                negative_hits = [k for k in case.get('negative_keywords', []) if k.lower() in response.lower()]
-                if negative_hits:
+                # Check for negative keywords (list them only when one is present)
+                if any(n in rl for n in case['_negative_lower']):
+                    negative_hits = [k for k, n in zip(case.get('negative_keywords', []), case['_negative_lower']) if n in rl]
                     score = 0.0
                     reason = f"Negative keyword: {negative_hits}"
                 else:
                     needed = case.get('expected_keywords', [])
-                    hits = [k for k in needed if k.lower() in response.lower()]
+                    # Scoring only tells 0, 1 and 2+ hits apart, so stop at two;
+                    # cases with 2+ hits aren't printed, so the list stays complete.
+                    # Scan the head first, the whole response only if that finds < 2
+                    for text in (rl[:MAX_SCAN_CHARS], rl):
+                        hits = list(islice((k for k, kl in zip(needed, case['_expected_lower']) if kl in text), 2))
+                        if len(hits) >= 2 or len(rl) <= MAX_SCAN_CHARS: break
                     
                     if not needed: score = 1.0
                     else:
@@ -1,4 +1,5 @@
 import json
+from operator import itemgetter
 
 preamble = """# 📊 Malaya LLM Benchmark Baseline Report
 
@@ -101,29 +102,32 @@ After fine-tuning completes, re-run this benchmark and fill in the third column:
 |:---|:---|:---|:---|:---:|:---|:---:|
 """
 
+# Markdown cell escaping in one C-level pass: newlines -> <br>, pipes escaped, CR dropped
+_CLEAN_TABLE = str.maketrans({'\n': '<br>', '|': '\\|', '\r': ''})
+
+def clean(s):
+    if s is None: return ""
+    return str(s).translate(_CLEAN_TABLE)
+
+# Every row already ends in a newline, so the trailer adds just one more
+trailer = "\n---\n\n*(Note: Table excludes duplicate re-runs of the same case to keep it concise.)*\\n"
+
 with open('reports/benchmark_100_cases_final.json', 'r') as f:
     data = json.load(f)
 
-table_rows = []
-seen = set()
-details = sorted(data['details'], key=lambda x: x['id'])
-
-for case in details:
-    if case['id'] in seen: continue
-    seen.add(case['id'])
-    
-    q_icon = "✅ Pass" if case.get('raw_score', 0) == 1 else "❌ Fail"
-    m_icon = "✅ Pass" if case.get('malaya_score', 0) == 1 else "❌ Fail"
-    
-    def clean(s):
-        if s is None: return ""
-        return str(s).replace('\n', '<br>').replace('|', '\|').replace('\r', '')
-        
-    row = f"| {case['id']} | {clean(case.get('category'))} | {clean(case.get('input'))} | {clean(case.get('raw_output'))} | {q_icon} | {clean(case.get('malaya_output'))} | {m_icon} |"
-    table_rows.append(row)
-
-content = preamble + "\n".join(table_rows) + "\n\n---\n\n*(Note: Table excludes duplicate re-runs of the same case to keep it concise.)*\\n"
+# Drop re-runs first (first occurrence wins) so only unique cases get sorted
+unique = {}
+for case in data['details']:
+    unique.setdefault(case['id'], case)
+details = sorted(unique.values(), key=itemgetter('id'))
 
+# Stream rows straight to the report instead of joining one big string first
 with open('reports/benchmark_baseline.md', 'w') as f:
-    f.write(content)
+    f.write(preamble)
+    for case in details:
+        q_icon = "✅ Pass" if case.get('raw_score', 0) == 1 else "❌ Fail"
+        m_icon = "✅ Pass" if case.get('malaya_score', 0) == 1 else "❌ Fail"
+        
+        f.write(f"| {case['id']} | {clean(case.get('category'))} | {clean(case.get('input'))} | {clean(case.get('raw_output'))} | {q_icon} | {clean(case.get('malaya_output'))} | {m_icon} |\n")
+    f.write(trailer)
     print("Successfully wrote reports/benchmark_baseline.md")
@@ -25,6 +25,9 @@ NEW_MODEL_INFO = """MODEL_INFO = {
     "mistral": {"company": "Mistral AI", "logo": "/static/logos/opensource.png"} 
 }"""
 
+# Matches MODEL_INFO = { ... } potentially taking up multiple lines
+_MODEL_INFO_RE = re.compile(r"MODEL_INFO = \{.*?\}", re.DOTALL)
+
 def update_server():
     server_path = "benchmark-tracker/server.py"
     
@@ -35,13 +38,9 @@ def update_server():
     with open(server_path, "r") as f:
         content = f.read()
 
-    # Regex to find MODEL_INFO block
-    # Matches MODEL_INFO = { ... } potentially taking up multiple lines
-    pattern = r"MODEL_INFO = \{.*?\}"
-    
-    # Check if we can find it
-    if re.search(pattern, content, re.DOTALL):
-        new_content = re.sub(pattern, NEW_MODEL_INFO, content, flags=re.DOTALL)
+    # Substitute and count in one pass; nothing to write if the block is missing
+    new_content, count = _MODEL_INFO_RE.subn(NEW_MODEL_INFO, content)
+    if count:
         with open(server_path, "w") as f:
             f.write(new_content)
         print("Successfully updated MODEL_INFO in server.py")
@@ -1,12 +1,8 @@
-import json
+from notebook_patch import patch_notebook_sources
 
 notebook_path = "Malaya_LLM_Finetune.ipynb"
 
-with open(notebook_path, 'r') as f:
-    nb = json.load(f)
-
 # 1. Update Cell 2 (Model Loading) to swap to 7B
-model_load_source =  nb['cells'][2]['source']
 new_model_source = [
     "from unsloth import FastLanguageModel\n",
     "import torch\n",
@@ -25,13 +21,10 @@ new_model_source = [
     ")\n",
     "print(\"✅ Model loaded! Using Qwen 2.5 7B (Lightweight Version)\")"
 ]
-nb['cells'][2]['source'] = new_model_source
 
 
 # 2. Update Cell 5 (Trainer Setup) to add max_steps limit
 # We need to find the specific line in the source array and inject max_steps
-trainer_source = nb['cells'][5]['source']
-
 # Use a clean replacement of the TrainingArgs section
 # We iterate to find where 'num_train_epochs = 1' is
 new_trainer_source = [
@@ -103,9 +96,13 @@ new_trainer_source = [
     "print(\"✅ Trainer ready! Optimized for Free Colab (3000 Steps Limit).\")"
 ]
 
-nb['cells'][5]['source'] = new_trainer_source
+# Patch just these two cells in place (located by their content, not index);
+# the rest of the notebook is left byte-for-byte as it is
+missing = patch_notebook_sources(notebook_path, {
+    "FastLanguageModel.from_pretrained(": new_model_source,
+    "SFTTrainer(": new_trainer_source,
+})
+if missing:
+    print(f"Could not find cells containing: {sorted(missing)}")
 
-with open(notebook_path, 'w') as f:
-    json.dump(nb, f, indent=4) # Clean indentation
-    
 print("Successfully switched to 7B model and applied 3000 max_steps limit.")
@@ -1,10 +1,7 @@
-import json
+from notebook_patch import patch_notebook_sources
 
 notebook_path = "Malaya_LLM_Finetune.ipynb"
 
-with open(notebook_path, 'r') as f:
-    nb = json.load(f)
-
 # Find the cell that sets up the trainer
 # The logic handles:
 # 1. Drive mounting
@@ -22,8 +19,6 @@ with open(notebook_path, 'r') as f:
 # Cell 4: Format dataset
 # Cell 5: Setup Trainer (THIS ONE)
 
-trainer_cell_source = nb['cells'][5]['source']
-
 # New source code for the cell
 new_source = [
     "from google.colab import drive\n",
@@ -94,11 +89,7 @@ new_source = [
     "print(\"✅ Trainer ready! Checkpoints enabled.\")"
 ]
 
-nb['cells'][5]['source'] = new_source
-
 # Update the Training execution cell (Cell 6) to use resume_from_checkpoint
-training_cell_source = nb['cells'][6]['source']
-
 # Modify starting code to resume if checkpoint found
 new_training_source = [
     "# IMPORTANT: When wandb asks, type 3 and press Enter!\n",
@@ -118,9 +109,13 @@ new_training_source = [
     "print(\"=\"*50)"
 ]
 
-nb['cells'][6]['source'] = new_training_source
+# Patch just cells 5 and 6 in place (located by their content, not index);
+# the rest of the notebook is left byte-for-byte as it is
+missing = patch_notebook_sources(notebook_path, {
+    "SFTTrainer(": new_source,
+    "trainer.train(": new_training_source,
+})
+if missing:
+    print(f"Could not find cells containing: {sorted(missing)}")
 
-with open(notebook_path, 'w') as f:
-    json.dump(nb, f, indent=4) # changed from default indent to 4 for niceness
-    
 print("Notebook updated successfully.")
@@ -5,50 +5,125 @@ Validate the shortforms lexicon against schema + guardrails.
 
 import argparse
 import json
+import os
 import re
 import sys
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache, partial
 from pathlib import Path
 
 from jsonschema import Draft7Validator
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
-DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-VERSION_RE = re.compile(r"^\d+\.\d+\.\d+$")
-ALLOWED_STATUS = {"active", "draft"}
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
-def _load_json(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+VERSION_RE = re.compile(r"\d+\.\d+\.\d+")
+ALLOWED_STATUS = {"active", "draft"}
 
 
-def _collect_terms(block: dict) -> dict:
-    return {k: v for k, v in block.items() if isinstance(k, str) and not k.startswith("_")}
+def _load_json(path: Path) -> dict:
+    # One read of the raw bytes; both parsers decode the UTF-8 themselves
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=4)
+def _validator(schema_path: str, mtime: float) -> tuple:
+    """
+    Checked, compiled validators; reused until the schema file changes.
+    Returns (Draft7Validator, fast_check), where fast_check is the
+    fastjsonschema-generated function or None if it isn't installed.
+    """
+    schema = _load_json(Path(schema_path))
+    Draft7Validator.check_schema(schema)
+    fast_check = None
+    if fastjsonschema is not None:
+        # No defaults (would mutate the data) and no formats (Draft7Validator
+        # doesn't check them without a format checker either)
+        fast_check = fastjsonschema.compile(schema, use_default=False, use_formats=False)
+    return Draft7Validator(schema), fast_check
+
+
+def _schema_errors(validator: Draft7Validator, fast_check, data: dict) -> list:
+    # The generated check is far quicker but stops at the first failure, so
+    # it only gates the full Draft 7 walk that reports every error
+    if fast_check is not None:
+        try:
+            fast_check(data)
+            return []
+        except fastjsonschema.JsonSchemaException:
+            pass
+    return sorted(validator.iter_errors(data), key=lambda e: e.path)
+
+
+def _collect_term_keys(block: dict) -> set:
+    # Callers only need the term names (counts, overlaps), not their payloads
+    return {k for k in block if isinstance(k, str) and not k.startswith("_")}
+
+
+def _is_iso_date(value: str) -> bool:
+    # The regex pins the YYYY-MM-DD shape; fromisoformat rejects impossible dates
+    if not DATE_RE.fullmatch(value):
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
 
 
 def _validate_meta(meta: dict, errors: list, warnings: list) -> None:
-    if not DATE_RE.match(meta.get("last_updated", "")):
+    if not _is_iso_date(meta.get("last_updated", "")):
         warnings.append("`_meta.last_updated` should be YYYY-MM-DD.")
-    if not VERSION_RE.match(meta.get("version", "")):
+    if not VERSION_RE.fullmatch(meta.get("version", "")):
         warnings.append("`_meta.version` should be semantic versioning (x.y.z).")
 
 
+def _validate_one_dialect(item: tuple, min_terms: int) -> tuple:
+    """Checks one (name, payload) dialect; returns its own (errors, warnings)."""
+    name, payload = item
+    errors = []
+    warnings = []
+    if not isinstance(payload, dict):
+        errors.append(f"Dialect `{name}` should be an object.")
+        return errors, warnings
+    status = payload.get("_status", "").lower()
+    if status not in ALLOWED_STATUS:
+        errors.append(f"Dialect `{name}` has invalid _status: {status!r}.")
+    if not payload.get("_description"):
+        errors.append(f"Dialect `{name}` missing _description.")
+    term_count = len(_collect_term_keys(payload))
+    if status == "active" and term_count < min_terms:
+        errors.append(
+            f"Dialect `{name}` is active but has only {term_count} terms (min {min_terms})."
+        )
+    return errors, warnings
+
+
 def _validate_dialects(dialects: dict, errors: list, warnings: list, min_terms: int) -> None:
-    for name, payload in dialects.items():
-        if not isinstance(payload, dict):
-            errors.append(f"Dialect `{name}` should be an object.")
-            continue
-        status = payload.get("_status", "").lower()
-        if status not in ALLOWED_STATUS:
-            errors.append(f"Dialect `{name}` has invalid _status: {status!r}.")
-        if not payload.get("_description"):
-            errors.append(f"Dialect `{name}` missing _description.")
-        terms = _collect_terms(payload)
-        if status == "active" and len(terms) < min_terms:
-            errors.append(
-                f"Dialect `{name}` is active but has only {len(terms)} terms (min {min_terms})."
-            )
+    if not dialects:
+        return
+    # Dialects are independent; each worker returns local lists that are merged
+    # here in dialect order, so the report reads the same as a serial run
+    workers = min(os.cpu_count() or 1, len(dialects))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(partial(_validate_one_dialect, min_terms=min_terms), dialects.items())
+        for dialect_errors, dialect_warnings in results:
+            errors.extend(dialect_errors)
+            warnings.extend(dialect_warnings)
 
 
 def _validate_ambiguous(ambiguous: dict, errors: list) -> None:
@@ -85,14 +160,16 @@ def _validate_categories(meta: dict, dialects: dict, errors: list) -> None:
 
 
 def _find_overlaps(groups: dict) -> dict:
-    term_map = defaultdict(list)
-    for group, terms in groups.items():
-        for term in terms:
-            term_map[term].append(group)
-    overlaps = {
-        term: groups for term, groups in term_map.items() if len(groups) > 1
+    # groups maps name -> set of terms. Count each term once per group in C,
+    # then resolve owners only for the few terms in more than one group
+    counts = Counter()
+    for terms in groups.values():
+        counts.update(terms)
+    return {
+        term: [group for group, terms in groups.items() if term in terms]
+        for term, count in counts.items()
+        if count > 1
     }
-    return overlaps
 
 
 def main() -> int:
@@ -124,14 +201,13 @@ def main() -> int:
     schema_path = Path(args.schema)
 
     data = _load_json(data_path)
-    schema = _load_json(schema_path)
 
     errors = []
     warnings = []
 
-    validator = Draft7Validator(schema)
-    schema_errors = sorted(validator.iter_errors(data), key=lambda e: e.path)
-    for err in schema_errors:
+    # Keyed on mtime so repeat runs in one process (e.g. a hook) skip recompiling
+    validator, fast_check = _validator(str(schema_path), schema_path.stat().st_mtime)
+    for err in _schema_errors(validator, fast_check, data):
         path = ".".join(str(p) for p in err.path) or "root"
         errors.append(f"Schema error at {path}: {err.message}")
 
@@ -146,13 +222,13 @@ def main() -> int:
 
     # Overlap analysis (warning only)
     group_terms = {
-        "shortforms": _collect_terms(data.get("shortforms", {})),
-        "genz_tiktok": _collect_terms(data.get("genz_tiktok", {})),
-        "intensity_markers": _collect_terms(data.get("intensity_markers", {})),
-        "colloquialisms": _collect_terms(data.get("colloquialisms", {})),
+        "shortforms": _collect_term_keys(data.get("shortforms", {})),
+        "genz_tiktok": _collect_term_keys(data.get("genz_tiktok", {})),
+        "intensity_markers": _collect_term_keys(data.get("intensity_markers", {})),
+        "colloquialisms": _collect_term_keys(data.get("colloquialisms", {})),
     }
     for dialect_name, payload in dialects.items():
-        group_terms[f"dialect:{dialect_name}"] = _collect_terms(payload)
+        group_terms[f"dialect:{dialect_name}"] = _collect_term_keys(payload)
     overlaps = _find_overlaps(group_terms)
     if overlaps:
         warnings.append(
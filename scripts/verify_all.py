@@ -0,0 +1,30 @@
+import asyncio
+import os
+import sys
+
+# Sibling scripts are imported as modules; the repo root is needed for src.*
+scripts_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, scripts_dir)
+sys.path.append(os.path.join(scripts_dir, '..'))
+
+# verify_native_hf goes first: it sets the HF Hub env (telemetry/offline)
+# before importing transformers/torch
+import verify_native_hf
+import verify_native_full
+import verify_lite_mode
+
+# Pay for the heavy imports (transformers/torch, Malaya, RAG) once up front;
+# every verification below reuses these modules instead of a fresh interpreter
+import transformers
+from src.chatbot.services.malaya_service import MalayaService
+from src.rag.vector_service import VectorRAGService
+
+def main():
+    print("🩺 Running HF, native and lite verifications in one process...")
+    verify_native_hf.run_verification()
+    verify_native_full.run_verification()
+    # Lite mode sets MALAYA_FORCE_MOCK only for its own run
+    asyncio.run(verify_lite_mode.main())
+
+if __name__ == "__main__":
+    main()
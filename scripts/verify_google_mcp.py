@@ -19,19 +19,24 @@ async def main():
     tools = await manager.list_tools()
     print(f"\n✅ Total Tools Found: {len(tools)}")
     
-    print("\n🗺️  Google Maps Tools:")
+    # One pass splits the names; a name matching both lands in both lists
+    maps_tools, youtube_tools = [], []
     for t in tools:
-        if "maps" in t['name']:
-            print(f"   - {t['name']}")
+        name = t['name']
+        if "maps" in name:
+            maps_tools.append(name)
+        if "youtube" in name:
+            youtube_tools.append(name)
+
+    print("\n🗺️  Google Maps Tools:")
+    for name in maps_tools:
+        print(f"   - {name}")
 
     print("\n📺 YouTube Tools:")
-    found_youtube = False
-    for t in tools:
-        if "youtube" in t['name']:
-            found_youtube = True
-            print(f"   - {t['name']}")
+    for name in youtube_tools:
+        print(f"   - {name}")
     
-    if not found_youtube:
+    if not youtube_tools:
         print("   ❌ No YouTube tools found! Check installation of @kazuph/mcp-youtube")
 
     await manager.close()
@@ -12,10 +12,20 @@ sys.path.append(str(root_dir))
 # Configure basic logging
 logging.basicConfig(level=logging.INFO)
 
-# Force Mock (Lite) Mode
-os.environ["MALAYA_FORCE_MOCK"] = "1"
-
 async def main():
+    # Force Mock (Lite) Mode for this run only, so a combined runner
+    # (verify_all.py) can still exercise native mode in the same process
+    previous = os.environ.get("MALAYA_FORCE_MOCK")
+    os.environ["MALAYA_FORCE_MOCK"] = "1"
+    try:
+        await run_checks()
+    finally:
+        if previous is None:
+            os.environ.pop("MALAYA_FORCE_MOCK", None)
+        else:
+            os.environ["MALAYA_FORCE_MOCK"] = previous
+
+async def run_checks():
     print("🚀 Verifying Lite Mode Implementation...")
     
     # 1. Test LiteNormalizer
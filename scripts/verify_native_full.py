@@ -3,6 +3,13 @@ import sys
 import os
 import logging
 
+# Set before anything pulls in huggingface_hub (the RAG embeddings do).
+# With HF_OFFLINE=1 (warm cache, CI) models load from the local cache only.
+os.environ.setdefault("HF_HUB_DISABLE_TELEMETRY", "1")
+if os.environ.get("HF_OFFLINE") == "1":
+    os.environ.setdefault("HF_HUB_OFFLINE", "1")
+    os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
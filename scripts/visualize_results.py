@@ -1,65 +1,94 @@
 
 import json
+import matplotlib
+matplotlib.use("Agg") # file output only; skip interactive backend startup
 import matplotlib.pyplot as plt
 import pandas as pd
 import seaborn as sns
 from pathlib import Path
 
+try:
+    import pyarrow.json as paj
+except ImportError:
+    paj = None
+
 # SETTING THE "NANO BANANA PRO 3" AESTHETIC (Cyberpunk/Dark Mode)
 plt.style.use('dark_background')
 sns.set_palette("husl")
 
+PLOT_COLUMNS = ["category", "raw_score", "malaya_score"]
+
+def load_logs(log_path):
+    if paj is not None:
+        # Arrow parses in blocks into columnar buffers and only the plotted
+        # columns are converted, so the long response strings never reach pandas
+        table = paj.read_json(log_path, read_options=paj.ReadOptions(block_size=16 << 20))
+        return table.select(PLOT_COLUMNS).to_pandas()
+    # pandas parses the whole JSONL file in C, no per-line dicts
+    return pd.read_json(log_path, lines=True, dtype=False, convert_dates=False)
+
 def generate_charts():
     log_path = Path("reports/benchmark_100_cases_logs.jsonl")
+    output_path = Path("reports/benchmark_viz.png")
     if not log_path.exists():
         print("No log file found.")
         return
 
-    data = []
-    with open(log_path, "r") as f:
-        for line in f:
-            if line.strip():
-                try:
-                    data.append(json.loads(line))
-                except:
-                    pass
+    # Chart is newer than the logs it was drawn from; nothing to redo
+    if output_path.exists() and output_path.stat().st_mtime >= log_path.stat().st_mtime:
+        print(f"Chart is up to date: {output_path}")
+        return
+
+    try:
+        df = load_logs(log_path)
+    except (ValueError, KeyError):
+        # A corrupt line (or missing column) fails the fast path; skip bad
+        # lines as before
+        data = []
+        with open(log_path, "r") as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        data.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        pass
+        df = pd.DataFrame(data)
     
-    if not data:
+    if df.empty:
         print("No data found.")
         return
-
-    df = pd.DataFrame(data)
     
     # Process Data
     # Calculate Mean scores (0 or 1)
     # Filter timeouts if necessary, but for now treating 0 as 0
     
-    stats = []
+    score_cols = ["raw_score", "malaya_score"]
     
-    # Overall
-    raw_acc = df["raw_score"].mean() * 100
-    malaya_acc = df["malaya_score"].mean() * 100
-    stats.append({"Category": "OVERALL", "Model": "Raw Qwen", "Accuracy": raw_acc})
-    stats.append({"Category": "OVERALL", "Model": "Malaya LLM", "Accuracy": malaya_acc})
+    # Overall, then by category in one groupby pass (first-seen category order)
+    overall = df[score_cols].mean().mul(100).to_frame().T
+    overall.insert(0, "Category", "OVERALL")
+    by_cat = (
+        df.groupby("category", sort=False)[score_cols].mean().mul(100)
+        .reset_index().rename(columns={"category": "Category"})
+    )
+    # Categories where Malaya gains most over raw Qwen come first
+    delta = by_cat["malaya_score"] - by_cat["raw_score"]
+    by_cat = by_cat.iloc[delta.sort_values(ascending=False, kind="stable").index]
+    order = ["OVERALL"] + by_cat["Category"].tolist()
     
-    # By Category
-    cats = df["category"].unique()
-    for cat in cats:
-        sub = df[df["category"] == cat]
-        r = sub["raw_score"].mean() * 100
-        m = sub["malaya_score"].mean() * 100
-        stats.append({"Category": cat, "Model": "Raw Qwen", "Accuracy": r})
-        stats.append({"Category": cat, "Model": "Malaya LLM", "Accuracy": m})
-        
-    df_stats = pd.DataFrame(stats)
+    df_stats = (
+        pd.concat([overall, by_cat], ignore_index=True)
+        .melt(id_vars="Category", var_name="Model", value_name="Accuracy")
+    )
+    df_stats["Model"] = df_stats["Model"].map({"raw_score": "Raw Qwen", "malaya_score": "Malaya LLM"})
     
     # PLOT
-    plt.figure(figsize=(14, 8))
+    fig = plt.figure(figsize=(14, 8))
     
     # Custom colors: Raw=Red/Grey, Malaya=Neon Green
     palette = {"Raw Qwen": "#ff4d4d", "Malaya LLM": "#00ff99"}
     
-    sns.barplot(data=df_stats, x="Category", y="Accuracy", hue="Model", palette=palette)
+    sns.barplot(data=df_stats, x="Category", y="Accuracy", hue="Model", palette=palette, order=order)
     
     plt.title("Malaya LLM vs Raw Qwen: Accuracy Benchmark", fontsize=20, color="#ffffff", pad=20)
     plt.ylabel("Accuracy (%)", fontsize=14)
@@ -70,9 +99,11 @@ def generate_charts():
     plt.legend(title="Model", title_fontsize=12)
     
     # Save
-    output_path = "reports/benchmark_viz.png"
     plt.tight_layout()
-    plt.savefig(output_path, dpi=300, facecolor='#121212')
+    # 150 DPI is plenty for the report and rasterizes a quarter of the pixels
+    fig.savefig(output_path, dpi=150, facecolor='#121212')
+    # Free the Agg buffer rather than keeping figure state around
+    plt.close(fig)
     print(f"Chart saved to {output_path}")
 
 if __name__ == "__main__":
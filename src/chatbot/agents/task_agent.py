@@ -2,17 +2,185 @@
 Task Agent for multi-step task execution using LangGraph.
 Chains multiple tools together to complete complex requests.
 """
-from typing import TypedDict, Annotated, Sequence, List, Optional
+from typing import TypedDict, Annotated, List, Optional, Dict, Tuple
 from langgraph.graph import StateGraph, END
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
+from langgraph.graph.message import add_messages
+from langgraph.types import RetryPolicy
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
+from langchain_core.runnables import RunnableConfig
+from pydantic import BaseModel
+import asyncio
+import copy
+import json
+import logging
 import operator
+import re
+import threading
+
+import numpy as np
+
+try:
+    from sentence_transformers import SentenceTransformer
+except Exception:
+    SentenceTransformer = None
+
+logger = logging.getLogger(__name__)
+
+# Numbered plan lines; findall over the whole text yields each step's text
+# without its number in one pass, with no per-line strip/split copies
+_STEP_RE = re.compile(r"^[ \t]*\d+[.)][ \t]*(.+)$", re.MULTILINE)
+# Content words used to spot near-duplicate steps
+_WORD_RE = re.compile(r"\w{3,}")
+# Words suggesting a task needs live tools (maps, YouTube, files) between steps
+_TOOL_HINT_RE = re.compile(
+    r"\b(search|find|cari|nearby|directions?|route|maps?|places?|weather|cuaca|"
+    r"youtube|video|transcript|files?|documents?|dokumen|latest|terkini|news|berita)\b",
+    re.IGNORECASE,
+)
+
+# Shared by every node and kept free of per-request data, so all agent calls
+# start with the same bytes and providers with prefix caching (OpenAI,
+# Anthropic, vLLM --enable-prefix-caching) reuse its KV cache. Variable
+# content goes only in the human message that follows it.
+_SYSTEM_MESSAGE = SystemMessage(content="""You are a task agent that completes multi-step requests.
+Each message names the phase to perform: PLAN, EXECUTE or SUMMARIZE.
+
+PLAN: Break the request down into steps. Return ONLY a JSON array. Each step
+has an "id" (integer), a "desc" (an actionable description) and "depends_on"
+(ids of steps whose results it needs; empty if it can run straight away).
+Example:
+[{"id": 1, "desc": "Search for restaurants in KLCC", "depends_on": []},
+ {"id": 2, "desc": "Check the weather in KLCC", "depends_on": []},
+ {"id": 3, "desc": "Get directions to the top restaurant", "depends_on": [1]}]
+
+EXECUTE: Use the available tools to complete the given step. Be concise. When
+given several numbered steps, return ONLY a JSON object mapping each step
+number to its result, e.g. {"1": "...", "2": "..."}.
+
+SUMMARIZE: Summarize the results of the completed steps into a natural,
+conversational response.
+
+SOLVE: Plan the request, carry out every step yourself and summarize, all in
+one reply. Return ONLY a JSON object:
+{"steps": ["step description", ...], "results": ["result of each step", ...],
+ "summary": "the final response"}""")
+
+def _messages(prompt: str) -> List[BaseMessage]:
+    """The fixed system prefix followed by this call's variable content."""
+    return [_SYSTEM_MESSAGE, HumanMessage(content=prompt)]
+
+def _is_transient(exc: Exception) -> bool:
+    """Timeouts, dropped connections, rate limits (429) and 5xx are worth a retry."""
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+    status = getattr(exc, "status_code", None) or getattr(getattr(exc, "response", None), "status_code", None)
+    return isinstance(status, int) and (status == 429 or 500 <= status < 600)
+
+def _content(response) -> str:
+    """Text of an LLM response: chat models return messages, plain LLMs strings."""
+    content = getattr(response, "content", None)
+    return content if content is not None else str(response)
+
+class SingleShotResult(BaseModel):
+    """Plan, per-step results and summary from one SOLVE call."""
+    steps: List[str]
+    results: List[str]
+    summary: str
+
+class PlanCache:
+    """
+    Reuses plans for recurring tasks. Each planned task is stored with its
+    unit-normalized embedding; a new task whose cosine similarity to a cached
+    one reaches `threshold` gets that plan back and skips the planner call.
+    
+    Opt-in: pass an instance to TaskAgent(plan_cache=...). Without an
+    `encoder` (texts -> 2D array) it loads a sentence-transformers model.
+    Model loading and encoding block, so async callers run lookup/add in a
+    worker thread.
+    """
+    
+    DEFAULT_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
+    
+    def __init__(self, threshold: float = 0.90, max_entries: int = 512, encoder=None,
+                 model_name: str = DEFAULT_MODEL):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.model_name = model_name
+        self._encoder = encoder
+        self._failed = False
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._plans: List[List[dict]] = []
+        self._matrix = None
+    
+    @property
+    def enabled(self) -> bool:
+        if self._failed:
+            return False
+        return self._encoder is not None or SentenceTransformer is not None
+    
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        try:
+            with self._load_lock:
+                # Concurrent first lookups load the model once
+                if self._encoder is None:
+                    model = SentenceTransformer(self.model_name)
+                    self._encoder = lambda texts: model.encode(texts, normalize_embeddings=True)
+            vector = np.asarray(self._encoder([text]), dtype=np.float32)[0]
+        except Exception as e:
+            logger.warning(f"Plan cache disabled: {e}")
+            self._failed = True
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    
+    def lookup(self, task: str) -> Tuple[Optional[List[dict]], Optional[np.ndarray]]:
+        """
+        (cached plan for a sufficiently similar task or None, the task's
+        embedding). Pass the embedding on to add() so a miss isn't embedded twice.
+        """
+        if not self.enabled:
+            return None, None
+        vector = self._embed(task)
+        if vector is None:
+            return None, None
+        with self._lock:
+            if self._matrix is None:
+                return None, vector
+            sims = self._matrix @ vector
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                return None, vector
+            logger.info(f"planner cache hit sim={sims[best]:.3f}")
+            # Callers get their own copy of the step dicts
+            return copy.deepcopy(self._plans[best]), vector
+    
+    def add(self, task: str, plan: List[dict], vector: Optional[np.ndarray] = None) -> None:
+        if not plan or not self.enabled:
+            return
+        if vector is None:
+            vector = self._embed(task)
+        if vector is None:
+            return
+        with self._lock:
+            # Oldest entries drop off once the cache is full
+            keep = max(self.max_entries - 1, 0)
+            if self._matrix is None or keep == 0:
+                self._matrix = vector[None, :]
+                self._plans = []
+            else:
+                self._matrix = np.vstack([self._matrix[-keep:], vector])
+                self._plans = self._plans[-keep:]
+            self._plans.append(copy.deepcopy(plan))
 
 class AgentState(TypedDict):
     """State for the task agent."""
-    messages: Annotated[Sequence[BaseMessage], operator.add]
+    messages: Annotated[List[BaseMessage], add_messages]
+    plan: List[dict]
     current_step: int
     total_steps: int
-    steps_completed: List[dict]
+    steps_completed: Annotated[List[dict], operator.add]
+    coalesced_count: int
     final_result: Optional[str]
 
 class TaskAgent:
@@ -24,146 +192,386 @@ class TaskAgent:
         result = await agent.execute("Find a restaurant in KLCC, then get directions from my location")
     """
     
-    def __init__(self, llm, mcp_manager=None):
+    # Compiled once per process and shared by every instance; nodes find
+    # their agent through the run config instead of being bound methods
+    _compiled_graph = None
+    
+    # Adjacent steps whose content words overlap at least this much (relative
+    # to the shorter step) are run as one LLM call
+    COALESCE_THRESHOLD = 0.75
+    
+    # Transient LLM failures are retried with backoff where they happen
+    # instead of failing the run. plan and summarize are single LLM calls, so
+    # LangGraph retries those nodes whole (each attempt bounded by
+    # NODE_TIMEOUT_SECONDS). execute_all retries inside itself, per wave and
+    # per failed call (each wave bounded by STEP_TIMEOUT_SECONDS), so finished
+    # steps are never replayed and long plans get no overall deadline.
+    RETRY_POLICY = RetryPolicy(max_attempts=3, backoff_factor=2.0, retry_on=_is_transient)
+    NODE_TIMEOUT_SECONDS = 120.0
+    STEP_TIMEOUT_SECONDS = 120.0
+    
+    def __init__(self, llm, mcp_manager=None, plan_cache: Optional[PlanCache] = None):
         self.llm = llm
         self.mcp_manager = mcp_manager
-        self.graph = self._build_graph()
+        self.plan_cache = plan_cache
+        self.graph = self._get_graph()
+    
+    @staticmethod
+    def _agent_node(method_name: str, timed: bool = True):
+        """
+        Graph node that dispatches to the named method of the running agent,
+        bounded by NODE_TIMEOUT_SECONDS when `timed`.
+        """
+        async def node(state: AgentState, config: RunnableConfig) -> AgentState:
+            agent = config["configurable"]["agent"]
+            call = getattr(agent, method_name)(state)
+            if not timed:
+                return await call
+            return await asyncio.wait_for(call, timeout=agent.NODE_TIMEOUT_SECONDS)
+        node.__name__ = method_name
+        return node
     
-    def _build_graph(self) -> StateGraph:
-        """Builds the LangGraph workflow."""
+    @classmethod
+    def _get_graph(cls):
+        """Builds (on first use) and returns the shared LangGraph workflow."""
+        if cls._compiled_graph is not None:
+            return cls._compiled_graph
+        
         workflow = StateGraph(AgentState)
         
         # Add nodes
-        workflow.add_node("plan", self._plan_steps)
-        workflow.add_node("execute_step", self._execute_step)
-        workflow.add_node("summarize", self._summarize_results)
+        workflow.add_node("plan", cls._agent_node("_plan_steps"), retry_policy=cls.RETRY_POLICY)
+        workflow.add_node("execute_all", cls._agent_node("_execute_all", timed=False))
+        workflow.add_node("summarize", cls._agent_node("_summarize_results"), retry_policy=cls.RETRY_POLICY)
         
         # Add edges
         workflow.set_entry_point("plan")
-        workflow.add_edge("plan", "execute_step")
-        workflow.add_conditional_edges(
-            "execute_step",
-            self._should_continue,
-            {
-                "continue": "execute_step",
-                "done": "summarize"
-            }
-        )
+        workflow.add_edge("plan", "execute_all")
+        workflow.add_edge("execute_all", "summarize")
         workflow.add_edge("summarize", END)
         
-        return workflow.compile()
+        cls._compiled_graph = workflow.compile()
+        return cls._compiled_graph
     
     async def _plan_steps(self, state: AgentState) -> AgentState:
         """Plans the steps needed to complete the task."""
         user_message = state["messages"][-1].content
         
-        planning_prompt = f"""Break down this request into sequential steps:
+        if self.plan_cache is not None:
+            # Off the event loop: the first call loads the model, every call encodes
+            cached_plan, task_vector = await asyncio.to_thread(self.plan_cache.lookup, user_message)
+            if cached_plan:
+                return {
+                    "plan": cached_plan,
+                    "total_steps": len(cached_plan),
+                    "current_step": 0,
+                    "messages": [AIMessage(content=f"Plan (cached):\n{json.dumps(cached_plan, ensure_ascii=False)}")]
+                }
+        
+        planning_prompt = f"""PLAN this request:
 "{user_message}"
 
-Return a numbered list of steps. Each step should be actionable.
-Example:
-1. Search for restaurants in KLCC
-2. Filter by rating > 4.0
-3. Get directions to the top result
-
 Steps:"""
         
-        response = await self.llm.ainvoke(planning_prompt)
-        plan_text = response.content if hasattr(response, 'content') else str(response)
+        response = await self.llm.ainvoke(_messages(planning_prompt))
+        plan_text = _content(response)
         
-        # Parse steps (simple line-based parsing)
-        steps = [line.strip() for line in plan_text.split("\n") if line.strip() and line.strip()[0].isdigit()]
+        plan = self._parse_plan(plan_text)
+        if self.plan_cache is not None:
+            await asyncio.to_thread(self.plan_cache.add, user_message, plan, task_vector)
         
+        # Nodes return only the channels they change; reducers do the appending
         return {
-            **state,
-            "total_steps": len(steps),
+            "plan": plan,
+            "total_steps": len(plan),
             "current_step": 0,
-            "steps_completed": [],
-            "messages": state["messages"] + [AIMessage(content=f"Plan:\n{plan_text}")]
+            "messages": [AIMessage(content=f"Plan:\n{plan_text}")]
         }
     
-    async def _execute_step(self, state: AgentState) -> AgentState:
-        """Executes the current step."""
-        current = state["current_step"]
-        
-        # Get the step description from the plan
-        plan_message = state["messages"][-1].content
-        steps = [line.strip() for line in plan_message.split("\n") if line.strip() and line.strip()[0].isdigit()]
+    @staticmethod
+    def _parse_plan(plan_text: str) -> List[dict]:
+        """
+        Parses the planner output into [{"id", "desc", "depends_on"}, ...].
+        Falls back to a numbered list, run strictly in order, if the model
+        did not return usable JSON.
+        """
+        start, end = plan_text.find("["), plan_text.rfind("]")
+        try:
+            raw_steps = json.loads(plan_text[start:end + 1]) if start != -1 else None
+        except ValueError:
+            raw_steps = None
         
-        if current >= len(steps):
-            return state
-            
-        step_description = steps[current]
+        plan = []
+        if isinstance(raw_steps, list):
+            for raw in raw_steps:
+                if not isinstance(raw, dict) or not raw.get("desc"):
+                    continue
+                try:
+                    step_id = int(raw.get("id", len(plan) + 1))
+                    depends_on = [int(d) for d in raw.get("depends_on") or []]
+                except (TypeError, ValueError):
+                    continue
+                plan.append({"id": step_id, "desc": str(raw["desc"]), "depends_on": depends_on})
         
-        # Execute the step using tools
-        execution_prompt = f"""Execute this step: {step_description}
+        if not plan:
+            # Numbered lines ("1. ...", "2) ..."): each step waits for the one
+            # before it. The match also strips the numbering from the text.
+            descs = [desc.strip() for desc in _STEP_RE.findall(plan_text)]
+            return [
+                {"id": i + 1, "desc": desc, "depends_on": [i] if i else []}
+                for i, desc in enumerate(descs)
+            ]
         
-Use the available tools to complete this task. Be concise."""
+        # Drop dependencies on unknown (or the step's own) ids so they can't stall
+        known = {step["id"] for step in plan}
+        for step in plan:
+            step["depends_on"] = [d for d in step["depends_on"] if d in known and d != step["id"]]
+        return plan
+    
+    @classmethod
+    def _coalesce_plan(cls, plan: List[dict]) -> List[dict]:
+        """
+        Merges runs of adjacent near-duplicate steps ("search X", then
+        "search X filtered by Y") into one unit executed by a single call.
+        Returns units shaped like plan steps plus a "subtasks" list of the
+        original steps. A step only joins the unit before it if it needs
+        nothing beyond what that unit already depends on, so no cycles form.
+        """
+        units = []
+        remap: Dict[int, int] = {}
+        last_words = set()
+        for step in plan:
+            words = set(_WORD_RE.findall(step["desc"].lower()))
+            if units and words and last_words:
+                unit = units[-1]
+                allowed = set(unit["depends_on"]) | {sub["id"] for sub in unit["subtasks"]}
+                overlap = len(words & last_words) / min(len(words), len(last_words))
+                if overlap >= cls.COALESCE_THRESHOLD and set(step["depends_on"]) <= allowed:
+                    unit["subtasks"].append(step)
+                    remap[step["id"]] = unit["id"]
+                    last_words = words
+                    continue
+            units.append({**step, "subtasks": [step]})
+            last_words = words
         
+        for unit in units:
+            members = {sub["id"] for sub in unit["subtasks"]}
+            unit["depends_on"] = sorted(
+                {remap.get(d, d) for d in unit["depends_on"] if d not in members} - {unit["id"]}
+            )
+        return units
+    
+    def _step_prompt(self, step: dict, results: Dict[int, str], plan_by_id: Dict[int, dict]) -> str:
+        """Builds the prompt for one unit, given the results of the units it depends on."""
+        subtasks = step["subtasks"]
+        if len(subtasks) == 1:
+            execution_prompt = f"EXECUTE this step: {step['desc']}"
+        else:
+            listed = "\n".join(f"{i}. {sub['desc']}" for i, sub in enumerate(subtasks, 1))
+            execution_prompt = f"EXECUTE these closely related steps together:\n{listed}"
+        # A step forced out of a dependency cycle may be missing some results
+        done = [d for d in step["depends_on"] if d in results]
+        if done:
+            earlier = "\n".join(f"- {plan_by_id[d]['desc']}: {results[d]}" for d in done)
+            execution_prompt += f"\n\nResults of earlier steps:\n{earlier}"
+        return execution_prompt
+    
+    @staticmethod
+    def _split_results(output: str, subtasks: List[dict]) -> List[str]:
+        """Per-subtask results of a coalesced call (whole output if unparseable)."""
+        if len(subtasks) == 1:
+            return [output]
+        start, end = output.find("{"), output.rfind("}")
+        try:
+            parsed = json.loads(output[start:end + 1]) if start != -1 else None
+        except ValueError:
+            parsed = None
+        if not isinstance(parsed, dict):
+            return [output] * len(subtasks)
+        return [str(parsed.get(str(i), output)) for i in range(1, len(subtasks) + 1)]
+    
+    async def _invoke_many(self, prompts: List[str]) -> List[str]:
+        """
+        Runs independent prompts as one batch. LangChain's abatch lets a
+        batching backend (vLLM, OpenAI-compatible servers) serve them together;
+        clients without it get the same prompts concurrently via ainvoke.
+        """
         # For now, use LLM directly (in production, would route to MCP tools)
-        response = await self.llm.ainvoke(execution_prompt)
-        result = response.content if hasattr(response, 'content') else str(response)
+        inputs = [_messages(p) for p in prompts]
+        outputs: List[Optional[str]] = [None] * len(inputs)
+        pending = list(range(len(inputs)))
+        policy = self.RETRY_POLICY
+        delay = policy.initial_interval
+        for attempt in range(1, policy.max_attempts + 1):
+            responses = await self._call_batch([inputs[i] for i in pending])
+            failed = []
+            for i, response in zip(pending, responses):
+                if not isinstance(response, BaseException):
+                    outputs[i] = _content(response)
+                elif attempt == policy.max_attempts or not policy.retry_on(response):
+                    raise response
+                else:
+                    failed.append(i)
+            if not failed:
+                break
+            # Only the calls that failed go again; their wave-mates keep results
+            logger.warning(f"Retrying {len(failed)} step call(s) after transient failure (attempt {attempt})")
+            pending = failed
+            await asyncio.sleep(delay)
+            delay = min(delay * policy.backoff_factor, policy.max_interval)
+        return outputs
+    
+    async def _call_batch(self, inputs: List[List[BaseMessage]]) -> list:
+        """
+        One attempt at a wave: each input's response, or the exception it
+        raised. A wave that outlives STEP_TIMEOUT_SECONDS fails as a whole.
+        """
+        if hasattr(self.llm, "abatch"):
+            call = self.llm.abatch(inputs, return_exceptions=True)
+        else:
+            call = asyncio.gather(*(self.llm.ainvoke(m) for m in inputs), return_exceptions=True)
+        try:
+            return await asyncio.wait_for(call, timeout=self.STEP_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError as e:
+            return [e] * len(inputs)
+    
+    async def _execute_all(self, state: AgentState) -> AgentState:
+        """
+        Executes the whole plan. Every step whose dependencies are done runs
+        concurrently with the others in its wave, so wall time follows the
+        plan's critical path rather than its length.
+        """
+        plan = state["plan"]
+        units = self._coalesce_plan(plan)
+        units_by_id = {unit["id"]: unit for unit in units}
+        pending = dict(units_by_id)
+        results: Dict[int, str] = {}       # per unit, fed to dependent units
+        step_results: Dict[int, str] = {}  # per original plan step
+        
+        while pending:
+            ready = [
+                unit for unit in pending.values()
+                if all(d in results for d in unit["depends_on"])
+            ]
+            if not ready:
+                # Dependency cycle: break it by running the earliest step
+                ready = [next(iter(pending.values()))]
+            outputs = await self._invoke_many(
+                [self._step_prompt(unit, results, units_by_id) for unit in ready]
+            )
+            for unit, output in zip(ready, outputs):
+                parts = self._split_results(output, unit["subtasks"])
+                for sub, part in zip(unit["subtasks"], parts):
+                    step_results[sub["id"]] = part
+                if len(parts) == 1:
+                    results[unit["id"]] = output
+                else:
+                    results[unit["id"]] = "\n".join(
+                        f"{sub['desc']}: {part}" for sub, part in zip(unit["subtasks"], parts)
+                    )
+                del pending[unit["id"]]
         
-        completed = state["steps_completed"] + [{
-            "step": current + 1,
-            "description": step_description,
-            "result": result
-        }]
+        # Report in plan order regardless of completion order
+        completed = [
+            {"step": i + 1, "description": step["desc"], "result": step_results[step["id"]]}
+            for i, step in enumerate(plan)
+        ]
         
+        # Step results live in steps_completed only; the conversation gets a
+        # single summary message instead of one message per step
         return {
-            **state,
-            "current_step": current + 1,
+            "current_step": len(plan),
             "steps_completed": completed,
-            "messages": state["messages"] + [AIMessage(content=f"Step {current + 1}: {result}")]
+            "coalesced_count": len(plan) - len(units),
         }
     
-    def _should_continue(self, state: AgentState) -> str:
-        """Determines if we should continue to the next step or finish."""
-        if state["current_step"] >= state["total_steps"]:
-            return "done"
-        return "continue"
-    
     async def _summarize_results(self, state: AgentState) -> AgentState:
         """Summarizes all completed steps into a final result."""
-        steps_text = "\n".join([
-            f"Step {s['step']}: {s['result']}" 
-            for s in state["steps_completed"]
-        ])
+        steps_text = "\n".join(f"Step {s['step']}: {s['result']}" for s in state["steps_completed"])
         
-        summary_prompt = f"""Summarize the results of these completed steps into a helpful response:
+        summary_prompt = f"""SUMMARIZE these completed steps:
 
 {steps_text}
 
-Provide a natural, conversational summary:"""
+Summary:"""
         
-        response = await self.llm.ainvoke(summary_prompt)
-        summary = response.content if hasattr(response, 'content') else str(response)
+        response = await self.llm.ainvoke(_messages(summary_prompt))
+        summary = _content(response)
         
         return {
-            **state,
             "final_result": summary,
-            "messages": state["messages"] + [AIMessage(content=summary)]
+            "messages": [AIMessage(content=summary)]
+        }
+    
+    def _needs_tools(self, task: str) -> bool:
+        # Without an MCP manager nothing could call a tool between steps anyway
+        return self.mcp_manager is not None and bool(_TOOL_HINT_RE.search(task))
+    
+    async def _single_shot(self, task: str) -> Optional[dict]:
+        """
+        Plans, executes and summarizes in one LLM call instead of N+2. Returns
+        None when the reply isn't a valid SingleShotResult, so the caller can
+        fall back to the step-by-step graph.
+        """
+        messages = _messages(f'SOLVE this request:\n"{task}"')
+        try:
+            structured = self.llm.with_structured_output(SingleShotResult)
+        except (AttributeError, NotImplementedError):
+            structured = None
+        try:
+            if structured is not None:
+                result = await structured.ainvoke(messages)
+            else:
+                text = _content(await self.llm.ainvoke(messages))
+                result = SingleShotResult.model_validate_json(text[text.find("{"):text.rfind("}") + 1])
+        except ValueError as e:
+            logger.warning(f"Single-shot reply unusable, running full graph: {e}")
+            return None
+        if result is None:  # structured output found no tool call to parse
+            return None
+        
+        return {
+            "steps": [
+                {
+                    "step": i + 1,
+                    "description": desc,
+                    "result": result.results[i] if i < len(result.results) else "",
+                }
+                for i, desc in enumerate(result.steps)
+            ],
+            "result": result.summary,
         }
     
-    async def execute(self, task: str) -> dict:
+    async def execute(self, task: str, single_shot: bool = False) -> dict:
         """
         Executes a multi-step task.
         
         Args:
             task: Natural language description of the task
+            single_shot: Try answering in one LLM call first; used only when
+                the task doesn't look like it needs tools
             
         Returns:
             dict with steps_completed and final_result
         """
+        if single_shot and not self._needs_tools(task):
+            result = await self._single_shot(task)
+            if result is not None:
+                return result
+        
         initial_state: AgentState = {
             "messages": [HumanMessage(content=task)],
+            "plan": [],
             "current_step": 0,
             "total_steps": 0,
             "steps_completed": [],
+            "coalesced_count": 0,
             "final_result": None
         }
         
-        final_state = await self.graph.ainvoke(initial_state)
+        final_state = await self.graph.ainvoke(
+            initial_state, config={"configurable": {"agent": self}}
+        )
         
         return {
             "steps": final_state["steps_completed"],
@@ -8,8 +8,199 @@ It does NOT replace LangChain - it works alongside it.
 """
 
 import dspy
-from typing import List, Dict, Optional
+import asyncio
+from collections import OrderedDict
+from functools import cached_property
+from typing import List, Dict, Optional, Sequence, Tuple
+import json
 import os
+import re
+import threading
+
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except Exception:
+    SentenceTransformer = None
+
+
+# ============================================================
+# DETERMINISTIC SLANG EXPANSION
+# ============================================================
+
+# Fixed shortform -> standard Malay expansions, applied in Python by
+# preprocess_query. The engine sends raw user text to the LLM, so the enhanced
+# system prompt still spells these out as well.
+SLANG_EXPANSIONS = {
+    "xleh": "tak boleh",
+    "xblh": "tak boleh",
+    "xde": "tiada",
+    "xfhm": "tak faham",
+    "xphm": "tak faham",
+    "xtau": "tak tahu",
+    "xnk": "tak nak",
+    "mcm mane": "macam mana",
+    "nk": "nak",
+    "dh": "dah",
+    "tp": "tapi",
+    "sbb": "sebab",
+    "skrg": "sekarang",
+    "nnt": "nanti",
+    "jmpa": "jumpa",
+    "bgtau": "beritahu",
+    "tgk": "tengok",
+    "blh": "boleh",
+    "tlg": "tolong",
+}
+
+_LEXICON_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "shortforms.json")
+
+
+# Lexicon sections whose terms the fixed table above doesn't resolve
+_SHORTFORM_SECTIONS = ("shortforms", "genz_tiktok", "intensity_markers", "colloquialisms")
+
+# A vowel-less run of letters ("xjd", "bkn") is almost always an abbreviation
+_ABBREVIATION_RE = re.compile(r"(?<!\w)[b-df-hj-np-tv-xz]{2,}(?!\w)")
+
+
+def _load_lexicon() -> dict:
+    try:
+        with open(_LEXICON_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _load_ambiguous_terms(lexicon: Optional[dict] = None) -> List[str]:
+    """Context-dependent terms from the lexicon; these still need the LLM."""
+    block = (lexicon if lexicon is not None else _load_lexicon()).get("ambiguous_terms", {})
+    return [str(k).lower() for k in block if not str(k).startswith("_")]
+
+
+def _load_unresolved_terms(lexicon: Optional[dict] = None) -> List[str]:
+    """
+    Terms that still need the LLM normalizer after SLANG_EXPANSIONS has run:
+    ambiguous terms plus every lexicon shortform the fixed table doesn't
+    cover. Words the table expands *to* are left out.
+    """
+    lexicon = lexicon if lexicon is not None else _load_lexicon()
+    resolved = set(SLANG_EXPANSIONS)
+    for expansion in SLANG_EXPANSIONS.values():
+        resolved.update(expansion.split())
+    terms = set(_load_ambiguous_terms(lexicon))
+    for section in _SHORTFORM_SECTIONS:
+        block = lexicon.get(section, {})
+        if not isinstance(block, dict):
+            continue
+        for short, full in block.items():
+            short = str(short).lower()
+            if short.startswith("_") or short in resolved or short == str(full).lower():
+                continue
+            terms.add(short)
+    return sorted(terms)
+
+
+def _is_word_char(char: str) -> bool:
+    # Same class as regex \w (the fallback's boundary): alphanumerics and "_"
+    return char.isalnum() or char == "_"
+
+
+class TermMatcher:
+    """
+    Finds whole-word occurrences of a fixed set of lowercase terms in one
+    left-to-right pass, preferring the longest term at each position.
+    Uses an Aho-Corasick automaton when pyahocorasick is installed and a
+    single precompiled alternation otherwise.
+    """
+    
+    def __init__(self, terms):
+        terms = sorted({t.lower() for t in terms if t}, key=len, reverse=True)
+        self._automaton = None
+        self._pattern = None
+        if not terms:
+            return
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for term in terms:
+                self._automaton.add_word(term, term)
+            self._automaton.make_automaton()
+        else:
+            self._pattern = re.compile(r"(?<!\w)(?:" + "|".join(map(re.escape, terms)) + r")(?!\w)")
+    
+    def spans(self, lowered: str) -> List[Tuple[int, int, str]]:
+        """(start, end, term) for every non-overlapping whole-word match."""
+        if self._pattern is not None:
+            return [(m.start(), m.end(), m.group(0)) for m in self._pattern.finditer(lowered)]
+        if self._automaton is None:
+            return []
+        found = []
+        size = len(lowered)
+        for last, term in self._automaton.iter_long(lowered):
+            start, end = last - len(term) + 1, last + 1
+            if (start == 0 or not _is_word_char(lowered[start - 1])) and (
+                end == size or not _is_word_char(lowered[end])
+            ):
+                found.append((start, end, term))
+        return found
+
+
+# The prompt is constant, so it is built once at import rather than per call
+_ENHANCED_SYSTEM_PROMPT = """You are a helpful AI assistant that understands Malaysian Malay, English, and Manglish (mixed language).
+
+CRITICAL SLANG UNDERSTANDING:
+- 'xleh/xblh' = tak boleh (cannot)
+- 'xde' = tiada (don't have)
+- 'xfhm/xphm' = tak faham (don't understand)
+- 'xtau' = tak tahu (don't know)
+- 'xnk' = tak nak (don't want)
+- 'mcm mane' = macam mana (how)
+- 'nk/nak' = want to
+- 'dh' = dah/sudah (already)
+- 'tp' = tapi (but)
+- 'sbb' = sebab (because)
+- 'skrg' = sekarang (now)
+- 'nnt' = nanti (later)
+- 'jmpa' = jumpa (meet)
+- 'bgtau' = beritahu (tell)
+- 'tgk' = tengok (look)
+- 'blh' = boleh (can)
+- 'tlg' = tolong (help)
+
+PARTICLES & EMPHASIS:
+- 'la/lah' = emphasis particle
+- 'gila' = extremely (intensifier)
+- 'siot' = casual emphasis (like 'damn')
+- 'kot' = maybe/perhaps
+- 'je' = just/only
+- 'kan' = right? (tag question)
+- 'meh' = dismissive particle
+- 'wei/weh' = hey (attention getter)
+
+CULTURAL TERMS:
+- 'mamak' = Indian-Muslim restaurant
+- 'tapau' = takeaway
+- 'lepak' = hang out/chill
+- 'belanja' = treat (pay for someone)
+- 'teh tarik' = Malaysian pulled milk tea
+- 'nasi lemak' = Malaysian coconut rice
+- 'raya' = Eid celebration
+- 'sahur' = pre-dawn meal (Ramadan)
+- 'kenduri' = feast/celebration
+- 'balik kampung' = go back to hometown
+
+RESPONSE GUIDELINES:
+1. Mirror the user's language (Malay→Malay, Manglish→Manglish)
+2. Be casual and friendly, like chatting with a friend
+3. Show understanding of their slang before responding
+4. Use appropriate particles (la, lah, kan) for natural flow
+5. Stay on topic - don't go off on tangents
+"""
 
 
 # ============================================================
@@ -70,6 +261,13 @@ class MalayQAModule(dspy.Module):
     def forward(self, query: str, context: str = "") -> dspy.Prediction:
         """Process query and generate response."""
         return self.qa_chain(query=query, context=context)
+    
+    async def aforward(self, query: str, context: str = "") -> dspy.Prediction:
+        """Async variant of forward (used by acall)."""
+        if hasattr(self.qa_chain, "acall"):
+            return await self.qa_chain.acall(query=query, context=context)
+        # Older DSPy predictors have no acall
+        return await asyncio.to_thread(self.qa_chain, query=query, context=context)
 
 
 class SlangNormalizer(dspy.Module):
@@ -86,13 +284,21 @@ class SlangNormalizer(dspy.Module):
     def forward(self, slang_text: str) -> dspy.Prediction:
         """Translate slang to standard Malay."""
         return self.translator(slang_text=slang_text)
+    
+    async def aforward(self, slang_text: str) -> dspy.Prediction:
+        """Async variant of forward (used by acall)."""
+        if hasattr(self.translator, "acall"):
+            return await self.translator.acall(slang_text=slang_text)
+        # Older DSPy predictors have no acall
+        return await asyncio.to_thread(self.translator, slang_text=slang_text)
 
 
 # ============================================================
 # TRAINING DATA (Few-shot Examples)
 # ============================================================
 
-MALAY_SLANG_EXAMPLES = [
+# Immutable, so optimize() can hand it to the teleprompter as-is
+MALAY_SLANG_EXAMPLES = (
     # Shortforms
     dspy.Example(
         query="xleh la bro, aku xde duit skrg",
@@ -139,13 +345,26 @@ MALAY_SLANG_EXAMPLES = [
         understanding="I'm really frustrated with this service, it's slow like a snail",
         response="Aku faham frustration tu. Memang tak best bila kena tunggu lama. Ada apa yang aku boleh tolong?"
     ).with_inputs("query", "context"),
-]
+)
 
 
 # ============================================================
 # OPTIMIZER CLASS (Integrate with LangChain)
 # ============================================================
 
+# One dspy.LM per model name for the whole process, so extra optimizers (tests,
+# per-tenant instances) share its HTTP client instead of building their own
+_LM_CACHE: Dict[str, "dspy.LM"] = {}
+_LM_LOCK = threading.Lock()
+
+def _get_lm(model_name: str) -> "dspy.LM":
+    with _LM_LOCK:
+        lm = _LM_CACHE.get(model_name)
+        if lm is None:
+            lm = _LM_CACHE[model_name] = dspy.LM(f"ollama_chat/{model_name}")
+        return lm
+
+
 class DSPyOptimizer:
     """
     DSPy-based prompt optimizer for Malay/Manglish understanding.
@@ -154,29 +373,54 @@ class DSPyOptimizer:
     them to the LangChain-based engine.
     """
     
-    def __init__(self, model_name: str = "qwen3:14b"):
+    SLANG_CACHE_SIZE = 4096
+    SEMANTIC_CACHE_THRESHOLD = 0.95
+    SEMANTIC_CACHE_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
+    
+    def __init__(
+        self,
+        model_name: str = "qwen3:14b",
+        cache_backend=None,
+        semantic_cache: bool = False,
+    ):
         """
         Initialize DSPy optimizer.
         
         Args:
             model_name: LLM model to use for DSPy optimization (Ollama model name)
+            cache_backend: Optional store with slang_cache_get/slang_cache_set
+                (e.g. SQLiteStore) to keep normalizations across restarts
+            semantic_cache: Also reuse the normalization of a near-identical
+                earlier query (needs sentence-transformers)
         """
         self.model_name = model_name
         self.qa_module = MalayQAModule()
         self.slang_normalizer = SlangNormalizer()
+        self._slang_matcher = TermMatcher(SLANG_EXPANSIONS)
+        self._unresolved_matcher = TermMatcher(_load_unresolved_terms())
         self._setup_dspy()
         self._is_optimized = False
+        
+        # Slang normalization cache: exact (LRU) tier, optional persistent
+        # backend, optional semantic tier over query embeddings
+        self.cache_backend = cache_backend
+        self._slang_cache: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+        self._slang_lock = threading.Lock()
+        self._semantic_enabled = bool(semantic_cache and SentenceTransformer is not None)
+        self._embedder = None
+        self._embed_lock = threading.Lock()
+        self._semantic_keys: List[str] = []
+        self._semantic_matrix = np.empty((0, 0), dtype=np.float32)
     
     def _setup_dspy(self):
         """Configure DSPy with Ollama."""
         # Use Ollama for DSPy (free, local)
         try:
-            lm = dspy.LM(f"ollama_chat/{self.model_name}")
-            dspy.configure(lm=lm)
+            dspy.configure(lm=_get_lm(self.model_name))
         except Exception as e:
             print(f"Warning: Could not configure DSPy with Ollama: {e}")
     
-    def optimize(self, training_examples: Optional[List[dspy.Example]] = None):
+    def optimize(self, training_examples: Optional[Sequence[dspy.Example]] = None):
         """
         Optimize the DSPy module using few-shot examples.
         
@@ -198,6 +442,11 @@ class DSPyOptimizer:
         )
         self._is_optimized = True
     
+    @cached_property
+    def enhanced_system_prompt(self) -> str:
+        """System prompt for this optimizer; override in a subclass to change it."""
+        return _ENHANCED_SYSTEM_PROMPT
+    
     def get_enhanced_system_prompt(self) -> str:
         """
         Generate an enhanced system prompt with DSPy-learned patterns.
@@ -205,56 +454,7 @@ class DSPyOptimizer:
         Returns:
             Enhanced system prompt string for use with LangChain
         """
-        return """You are a helpful AI assistant that understands Malaysian Malay, English, and Manglish (mixed language).
-
-CRITICAL SLANG UNDERSTANDING:
-- 'xleh/xblh' = tak boleh (cannot)
-- 'xde' = tiada (don't have)
-- 'xfhm/xphm' = tak faham (don't understand)
-- 'xtau' = tak tahu (don't know)
-- 'xnk' = tak nak (don't want)
-- 'mcm mane' = macam mana (how)
-- 'nk/nak' = want to
-- 'dh' = dah/sudah (already)
-- 'tp' = tapi (but)
-- 'sbb' = sebab (because)
-- 'skrg' = sekarang (now)
-- 'nnt' = nanti (later)
-- 'jmpa' = jumpa (meet)
-- 'bgtau' = beritahu (tell)
-- 'tgk' = tengok (look)
-- 'blh' = boleh (can)
-- 'tlg' = tolong (help)
-
-PARTICLES & EMPHASIS:
-- 'la/lah' = emphasis particle
-- 'gila' = extremely (intensifier)
-- 'siot' = casual emphasis (like 'damn')
-- 'kot' = maybe/perhaps
-- 'je' = just/only
-- 'kan' = right? (tag question)
-- 'meh' = dismissive particle
-- 'wei/weh' = hey (attention getter)
-
-CULTURAL TERMS:
-- 'mamak' = Indian-Muslim restaurant
-- 'tapau' = takeaway
-- 'lepak' = hang out/chill
-- 'belanja' = treat (pay for someone)
-- 'teh tarik' = Malaysian pulled milk tea
-- 'nasi lemak' = Malaysian coconut rice
-- 'raya' = Eid celebration
-- 'sahur' = pre-dawn meal (Ramadan)
-- 'kenduri' = feast/celebration
-- 'balik kampung' = go back to hometown
-
-RESPONSE GUIDELINES:
-1. Mirror the user's language (Malay→Malay, Manglish→Manglish)
-2. Be casual and friendly, like chatting with a friend
-3. Show understanding of their slang before responding
-4. Use appropriate particles (la, lah, kan) for natural flow
-5. Stay on topic - don't go off on tangents
-"""
+        return self.enhanced_system_prompt
     
     def preprocess_query(self, query: str) -> Dict[str, str]:
         """
@@ -266,20 +466,234 @@ RESPONSE GUIDELINES:
         Returns:
             Dict with 'original', 'normalized', and 'context' keys
         """
+        answered, key = self._preprocess_without_llm(query)
+        if answered is not None:
+            return answered
         try:
             result = self.slang_normalizer(slang_text=query)
-            return {
-                "original": query,
-                "normalized": result.standard_text,
-                "slang_mapping": result.slang_mapping
-            }
         except Exception as e:
-            # Fallback if DSPy fails
+            # Fallback if DSPy fails (not cached, so the next call retries)
+            return self._unnormalized(query)
+        return self._store_normalization(query, key, result)
+    
+    async def apreprocess_query(self, query: str) -> Dict[str, str]:
+        """
+        Async variant of preprocess_query for use inside event loops
+        (LangGraph nodes, ASGI handlers): the LLM call never blocks the loop.
+        """
+        answered, key = self._preprocess_without_llm(query, blocking=False)
+        blocking_tiers = self.cache_backend is not None or self._semantic_enabled
+        if answered is None and blocking_tiers:
+            # The persistent read and embedding (and the first model load)
+            # block; keep them off the loop
+            answered = await asyncio.to_thread(self._blocking_cache_answer, query, key)
+        if answered is not None:
+            return answered
+        try:
+            result = await self._acall(self.slang_normalizer, slang_text=query)
+        except Exception as e:
+            return self._unnormalized(query)
+        if blocking_tiers:
+            return await asyncio.to_thread(self._store_normalization, query, key, result)
+        return self._store_normalization(query, key, result)
+    
+    @staticmethod
+    async def _acall(module, **kwargs):
+        # DSPy modules with aforward run natively async where this DSPy has
+        # Module.acall; anything else is a blocking call, so move it off the
+        # event loop
+        if hasattr(module, "aforward") and hasattr(module, "acall"):
+            return await module.acall(**kwargs)
+        return await asyncio.to_thread(module, **kwargs)
+    
+    def _has_unresolved(self, lowered: str) -> bool:
+        """
+        Whether the normalizer LLM is still needed: an ambiguous term, a
+        lexicon shortform the fixed table doesn't cover or a vowel-less
+        abbreviation is left in the (lowercased) text.
+        """
+        return bool(self._unresolved_matcher.spans(lowered)) or _ABBREVIATION_RE.search(lowered) is not None
+    
+    def _preprocess_without_llm(self, query: str, blocking: bool = True) -> Tuple[Optional[Dict[str, str]], str]:
+        """
+        Answers from the shortform table or the cache if possible.
+        Returns (result or None, cache key). With `blocking=False` the
+        persistent and semantic tiers are left for the caller to try.
+        """
+        # Fixed shortforms are expanded in Python; the LLM normalizer is only
+        # skipped when nothing unresolved is left
+        expanded, mapping = self.expand_slang(query)
+        if not self._has_unresolved(expanded.lower()):
             return {
                 "original": query,
-                "normalized": query,
-                "slang_mapping": "{}"
-            }
+                "normalized": expanded,
+                "slang_mapping": json.dumps(mapping, ensure_ascii=False)
+            }, ""
+        
+        key = self._slang_cache_key(query)
+        cached = self._slang_cache_get(key)
+        if cached is not None:
+            return {"original": query, **cached}, key
+        if blocking:
+            return self._blocking_cache_answer(query, key), key
+        return None, key
+    
+    def _blocking_cache_answer(self, query: str, key: str) -> Optional[Dict[str, str]]:
+        """The persistent tier, then the semantic one; both block."""
+        if self.cache_backend is not None:
+            entry = self.cache_backend.slang_cache_get(key)
+            if entry is not None:
+                self._remember(key, entry)
+                return {"original": query, **entry}
+        if self._semantic_enabled:
+            return self._semantic_answer(query, key)
+        return None
+    
+    def _store_normalization(self, query: str, key: str, result) -> Dict[str, str]:
+        entry = {
+            "normalized": result.standard_text,
+            "slang_mapping": result.slang_mapping
+        }
+        self._slang_cache_set(key, entry)
+        return {"original": query, **entry}
+    
+    @staticmethod
+    def _unnormalized(query: str) -> Dict[str, str]:
+        return {
+            "original": query,
+            "normalized": query,
+            "slang_mapping": "{}"
+        }
+    
+    def expand_slang(self, query: str) -> Tuple[str, Dict[str, str]]:
+        """
+        Replaces known shortforms with their standard form in one pass.
+        
+        Returns:
+            (expanded query, {shortform: expansion} for the terms found)
+        """
+        return self._replace_terms(query, self._slang_matcher, SLANG_EXPANSIONS)
+    
+    @staticmethod
+    def _replace_terms(query: str, matcher: "TermMatcher", table: Dict[str, str]) -> Tuple[str, Dict[str, str]]:
+        """Replaces each whole-word match of `matcher` with its `table` value."""
+        lowered = query.lower()
+        if len(lowered) != len(query):
+            # Rare case-folding length change; match on the query itself
+            lowered = query
+        parts = []
+        mapping = {}
+        pos = 0
+        for start, end, term in matcher.spans(lowered):
+            parts.append(query[pos:start])
+            parts.append(table[term])
+            mapping[term] = table[term]
+            pos = end
+        if not parts:
+            return query, mapping
+        parts.append(query[pos:])
+        return "".join(parts), mapping
+    
+    @staticmethod
+    def _slang_cache_key(query: str) -> str:
+        # Case and spacing never change what the slang means
+        return " ".join(query.lower().split())
+    
+    def _slang_cache_get(self, key: str) -> Optional[Dict[str, str]]:
+        # In-process tier only; the blocking ones are in _blocking_cache_answer
+        with self._slang_lock:
+            entry = self._slang_cache.get(key)
+            if entry is not None:
+                self._slang_cache.move_to_end(key)
+            return entry
+    
+    def _slang_cache_set(self, key: str, entry: Dict[str, str]) -> None:
+        self._remember(key, entry)
+        if self.cache_backend is not None:
+            self.cache_backend.slang_cache_set(key, entry)
+        if self._semantic_enabled:
+            self._semantic_add(key)
+    
+    def _remember(self, key: str, entry: Dict[str, str]) -> None:
+        with self._slang_lock:
+            self._slang_cache[key] = entry
+            self._slang_cache.move_to_end(key)
+            if len(self._slang_cache) > self.SLANG_CACHE_SIZE:
+                self._slang_cache.popitem(last=False)
+    
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        try:
+            with self._embed_lock:
+                # Callers may be worker threads; load the model only once
+                if self._embedder is None:
+                    self._embedder = SentenceTransformer(self.SEMANTIC_CACHE_MODEL)
+            return self._embedder.encode([text], normalize_embeddings=True)[0].astype(np.float32)
+        except Exception as e:
+            print(f"Warning: semantic slang cache disabled: {e}")
+            self._semantic_enabled = False
+            return None
+    
+    def _semantic_lookup(self, key: str) -> Optional[Dict[str, str]]:
+        if not self._semantic_keys:
+            return None
+        vector = self._embed(key)
+        if vector is None:
+            return None
+        with self._slang_lock:
+            # Rows are unit-normalized, so the dot product is cosine similarity
+            sims = self._semantic_matrix @ vector
+            best = int(np.argmax(sims))
+            if sims[best] < self.SEMANTIC_CACHE_THRESHOLD:
+                return None
+            return self._slang_cache.get(self._semantic_keys[best])
+    
+    def _semantic_answer(self, query: str, key: str) -> Optional[Dict[str, str]]:
+        """
+        Normalizes `query` with the slang mapping learned for a near-identical
+        earlier query. Only that mapping is reused, reapplied to this query's
+        own words, never the other query's normalized text; and only if it
+        leaves nothing unresolved here.
+        """
+        neighbour = self._semantic_lookup(key)
+        if neighbour is None:
+            return None
+        try:
+            learned = json.loads(neighbour.get("slang_mapping") or "{}")
+        except (TypeError, ValueError):
+            return None
+        if not isinstance(learned, dict):
+            return None
+        learned = {
+            str(term).lower(): value.strip()
+            for term, value in learned.items()
+            if str(term).strip() and isinstance(value, str) and value.strip()
+        }
+        expanded, mapping = self.expand_slang(query)
+        normalized, applied = self._replace_terms(expanded, TermMatcher(learned), learned)
+        if self._has_unresolved(normalized.lower()):
+            return None
+        mapping.update(applied)
+        return {
+            "original": query,
+            "normalized": normalized,
+            "slang_mapping": json.dumps(mapping, ensure_ascii=False)
+        }
+    
+    def _semantic_add(self, key: str) -> None:
+        vector = self._embed(key)
+        if vector is None:
+            return
+        with self._slang_lock:
+            if len(self._semantic_keys) >= self.SLANG_CACHE_SIZE:
+                # Rebuild from what the LRU tier still holds
+                live = [i for i, k in enumerate(self._semantic_keys) if k in self._slang_cache]
+                self._semantic_keys = [self._semantic_keys[i] for i in live]
+                self._semantic_matrix = self._semantic_matrix[live]
+            if self._semantic_matrix.size == 0:
+                self._semantic_matrix = vector[None, :]
+            else:
+                self._semantic_matrix = np.vstack([self._semantic_matrix, vector])
+            self._semantic_keys.append(key)
     
     def generate_response(self, query: str, context: str = "") -> Dict[str, str]:
         """
@@ -303,6 +717,20 @@ RESPONSE GUIDELINES:
                 "understanding": f"Error: {e}",
                 "response": ""
             }
+    
+    async def agenerate_response(self, query: str, context: str = "") -> Dict[str, str]:
+        """Async variant of generate_response; doesn't block the event loop."""
+        try:
+            result = await self._acall(self.qa_module, query=query, context=context)
+            return {
+                "understanding": result.understanding,
+                "response": result.response
+            }
+        except Exception as e:
+            return {
+                "understanding": f"Error: {e}",
+                "response": ""
+            }
 
 
 # ============================================================
@@ -321,9 +749,18 @@ def get_optimizer() -> DSPyOptimizer:
 
 def get_enhanced_prompt() -> str:
     """Get the DSPy-enhanced system prompt."""
-    return get_optimizer().get_enhanced_system_prompt()
+    # The prompt doesn't depend on the LM, so don't construct (and configure)
+    # the global optimizer just to read it
+    if _optimizer_instance is None:
+        return _ENHANCED_SYSTEM_PROMPT
+    return _optimizer_instance.get_enhanced_system_prompt()
 
 
 def preprocess_query(query: str) -> Dict[str, str]:
     """Preprocess a query using DSPy slang normalizer."""
     return get_optimizer().preprocess_query(query)
+
+
+async def apreprocess_query(query: str) -> Dict[str, str]:
+    """Async variant of preprocess_query."""
+    return await get_optimizer().apreprocess_query(query)
@@ -1,10 +1,13 @@
 import asyncio
+import copy
+import hashlib
 import os
 import sys
 import re
 import time
 import json
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
@@ -29,6 +32,21 @@ from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTempla
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, ToolMessage
 from langchain_core.output_parsers import StrOutputParser
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 try:
     from src.mcp.client import MCPClientManager
     MCP_AVAILABLE = True
@@ -92,18 +110,129 @@ TOOL_INJECTION_PATTERN = re.compile(
 
 PII_EMAIL_PATTERN = re.compile(r"([a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+)")
 PII_PHONE_PATTERN = re.compile(r"(\+?\d[\d\s\-()]{7,}\d)")
+# Both PII patterns as one alternation: a single scan of the text instead of two
+PII_PATTERN = re.compile(PII_EMAIL_PATTERN.pattern + "|" + PII_PHONE_PATTERN.pattern)
+_WORD_TERM_RE = re.compile(r"\w+")
 
 
 def _contains_pii(text: str) -> bool:
     if not text:
         return False
-    return bool(PII_EMAIL_PATTERN.search(text) or PII_PHONE_PATTERN.search(text))
+    return PII_PATTERN.search(text) is not None
+
+
+# libyaml's C loader when PyYAML was built with it; same results, far faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=8)
+def _parse_yaml(path: str, mtime: float) -> Any:
+    # mtime is only part of the key, so an edited file is parsed again
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def _load_yaml_cached(path) -> Any:
+    """
+    Parsed YAML file, reused across MalayaChatbot instances until the file
+    changes. Callers get their own copy, so mutations don't leak between them.
+    """
+    path = os.fspath(path)
+    return copy.deepcopy(_parse_yaml(path, os.path.getmtime(path)))
+
+
+def _is_word_char(char: str) -> bool:
+    # Same class as regex \w: Unicode alphanumerics plus underscore
+    return char.isalnum() or char == "_"
+
+
+# Playbook hints as (clauses, required dialect, hint): a hint applies when
+# every clause has at least one of its keywords somewhere in the lowercased
+# text and, if set, the user asked for that dialect
+_PLAYBOOK_TRIGGERS = [
+    (
+        (("python",), ("mac",), ("install", "pasang")), None,
+        "If asked about installing Python on Mac, suggest Homebrew "
+        "(`brew install python`) or the official installer from python.org, "
+        "then verify with `python3 --version`.",
+    ),
+    (
+        (("ptptn",),), None,
+        "If asked about PTPTN, outline: register on the official PTPTN portal, "
+        "prepare IC + offer letter + bank details, and open SSPN if required.",
+    ),
+    (
+        (("lhdn",), ("scam", "scammer", "call", "panggilan")), None,
+        "If scam LHDN call: hang up, do not share info, block the number, and report to NSRC/CCID/polis.",
+    ),
+    (
+        (("klinik",), ("24",)), None,
+        "For nearby 24-hour clinics, ask for location and suggest Google Maps/Waze or hospital emergency units.",
+    ),
+    (
+        (("panggung wayang", "wayang", "cinema"),), None,
+        "For nearby cinemas, suggest GSC/TGV/Star Cinemas and checking Google Maps for the closest branch.",
+    ),
+    (
+        (("cuti umum", "public holiday"),), None,
+        "Mention major holidays (CNY, Raya, Labour Day, Wesak, Agong's Birthday, National Day, "
+        "Malaysia Day, Deepavali, Christmas) and note that dates vary by state; check official calendars.",
+    ),
+    (
+        (("raya",), ("bila", "tarikh"), ("aidilfitri",)), None,
+        "Raya Aidilfitri date depends on official rukyah/hilal announcement; advise checking JAKIM/official calendar.",
+    ),
+    (
+        (("universiti malaya",), ("ranking", "rank", "world")), None,
+        "UM ranking changes yearly; advise checking QS World University Rankings or Times Higher Education.",
+    ),
+    (
+        (("jdt",), ("menang", "juara")), None,
+        "JDT often dominate Liga Super; if asking latest match, advise checking recent results.",
+    ),
+    (
+        (("translate", "terjemah"),), "Kelantanese",
+        "For Kelantan dialect, use: kawe (saya), demo (awak), cinto/sayang (love). "
+        "Keep it short and do not mention other dialects.",
+    ),
+    (
+        (("translate", "terjemah"), ("love you",)), "Kelantanese",
+        "If translating 'I love you', use: 'kawe cinto demo' with gloss 'saya sayang awak'.",
+    ),
+    (
+        # "ayam masak merah" itself contains both "ayam" and "merah"
+        (("ayam masak merah", "resepi"), ("ayam",), ("merah",)), None,
+        "Ayam masak merah: goreng ayam separuh masak, tumis bawang + cili kisar, "
+        "masuk sos cili/tomato + gula/garam, masukkan ayam dan gaul.",
+    ),
+    (
+        (("sahur",),), None,
+        "Sahur ialah makan sebelum subuh; 'lepas sahur' merujuk awal pagi, bukan waktu berbuka.",
+    ),
+    (
+        (("susah-susah", "tak payah", "tidak payah"),), None,
+        "Jika pengguna kata 'tak payah' atau 'susah-susah', maksudnya tiada perlu bersusah payah. Jawab ringkas sahaja.",
+    ),
+]
+_PLAYBOOK_KEYWORDS = sorted({k for clauses, _, _ in _PLAYBOOK_TRIGGERS for clause in clauses for k in clause})
+
+
+def _build_playbook_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _PLAYBOOK_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_PLAYBOOK_AUTOMATON = _build_playbook_automaton()
 
 
 class MalayaChatbot:
     def __init__(self, config_path="config.yaml", use_dspy: Optional[bool] = None):
-        with open(config_path, "r") as f:
-            self.config = yaml.safe_load(f)
+        self.config = _load_yaml_cached(config_path)
         
         self.normalizer = TextNormalizer()
         self.dialect_detector = DialectDetector()
@@ -167,6 +296,7 @@ class MalayaChatbot:
         self._malay_wordlist = None
         self._slang_markers = None
         self._slang_phrases = None
+        self._slang_automaton = None
         
         # v2: Malaya NLP Services (lazy-loaded)
         self._malaya_service = None
@@ -286,7 +416,7 @@ class MalayaChatbot:
         path = Path("docs/prompt_variants.yaml")
         if path.exists():
             try:
-                data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+                data = _load_yaml_cached(path) or {}
                 raw = data.get("variants", data) if isinstance(data, dict) else {}
                 if isinstance(raw, dict):
                     for key, value in raw.items():
@@ -352,8 +482,23 @@ class MalayaChatbot:
         return provider, model_name
 
     def _cache_key(self, payload: dict) -> str:
-        import json as _json
-        return _json.dumps(payload, sort_keys=True, ensure_ascii=True)
+        """
+        Fixed-size digest of the canonical (sorted-key) JSON of the payload,
+        instead of the JSON itself, so keys stay small however long the
+        history in the payload gets.
+        """
+        encoded = None
+        if orjson is not None:
+            try:
+                encoded = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+            except TypeError:
+                encoded = None  # e.g. non-str keys; stdlib json coerces those
+        if encoded is None:
+            encoded = json.dumps(payload, sort_keys=True, ensure_ascii=True).encode("utf-8")
+        # 128-bit digests: a collision would serve another request's answer
+        if xxhash is not None:
+            return xxhash.xxh3_128_hexdigest(encoded)
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
 
     def _tool_flag(self, tools, name: str, default: bool) -> bool:
         if tools is None:
@@ -388,6 +533,15 @@ class MalayaChatbot:
             return ""
         return f"Currency conversion (approx): {payload.get('from')} -> {converted}."
 
+    def _v2_vector_context(self, query: str) -> str:
+        """Lexicon context from the v2 vector service ("" on failure)."""
+        try:
+            return self.vector_service.get_context_for_query(query, top_k=3)
+        except Exception as e:
+            import logging
+            logging.warning(f"v2 vector search failed: {e}")
+            return ""
+
     def _get_malay_wordlist(self):
         """Load Malay wordlist from local dictionaries for language detection."""
         if self._malay_wordlist is not None:
@@ -435,12 +589,46 @@ class MalayaChatbot:
         self._slang_phrases = phrases
         return markers, phrases
 
+    def _get_slang_automaton(self):
+        """
+        Aho-Corasick automaton over every slang marker and phrase, so the
+        check is one pass over the text. None without pyahocorasick or with
+        an empty lexicon; the caller then falls back to token sets.
+        """
+        if self._slang_automaton is None:
+            self._slang_automaton = False
+            markers, phrases = self._get_slang_markers()
+            if ahocorasick is not None and (markers or phrases):
+                automaton = ahocorasick.Automaton()
+                # Phrases match anywhere; markers only as whole \w+ tokens, so
+                # markers with punctuation never matched and are left out
+                for phrase in phrases:
+                    automaton.add_word(phrase, (len(phrase), False))
+                for marker in markers:
+                    if _WORD_TERM_RE.fullmatch(marker):
+                        automaton.add_word(marker, (len(marker), True))
+                automaton.make_automaton()
+                self._slang_automaton = automaton
+        return self._slang_automaton or None
+
     def _has_slang_or_shortform(self, text: str) -> bool:
         """Detect slang/shortform markers for richer Malay/Manglish replies."""
         if not text:
             return False
-        markers, phrases = self._get_slang_markers()
         text_lower = text.lower()
+        automaton = self._get_slang_automaton()
+        if automaton is not None:
+            size = len(text_lower)
+            for end, (length, whole_word) in automaton.iter(text_lower):
+                if not whole_word:
+                    return True
+                start = end - length + 1
+                if (start == 0 or not _is_word_char(text_lower[start - 1])) and (
+                    end + 1 == size or not _is_word_char(text_lower[end + 1])
+                ):
+                    return True
+            return False
+        markers, phrases = self._get_slang_markers()
         tokens = set(re.findall(r"\b\w+\b", text_lower))
         if tokens & markers:
             return True
@@ -615,69 +803,22 @@ class MalayaChatbot:
         if not text:
             return ""
         lower = text.lower()
+        # One sweep for every trigger keyword; each hint is then set lookups
+        if _PLAYBOOK_AUTOMATON is not None:
+            hits = {keyword for _, keyword in _PLAYBOOK_AUTOMATON.iter(lower)}
+        else:
+            hits = {keyword for keyword in _PLAYBOOK_KEYWORDS if keyword in lower}
         hints = []
-        if "python" in lower and "mac" in lower and any(k in lower for k in ["install", "pasang"]):
-            hints.append(
-                "If asked about installing Python on Mac, suggest Homebrew "
-                "(`brew install python`) or the official installer from python.org, "
-                "then verify with `python3 --version`."
-            )
-        if "ptptn" in lower:
-            hints.append(
-                "If asked about PTPTN, outline: register on the official PTPTN portal, "
-                "prepare IC + offer letter + bank details, and open SSPN if required."
-            )
-        if "lhdn" in lower and any(k in lower for k in ["scam", "scammer", "call", "panggilan"]):
-            hints.append(
-                "If scam LHDN call: hang up, do not share info, block the number, and report to NSRC/CCID/polis."
-            )
-        if "klinik" in lower and ("24" in lower or "24 jam" in lower):
-            hints.append(
-                "For nearby 24-hour clinics, ask for location and suggest Google Maps/Waze or hospital emergency units."
-            )
-        if any(k in lower for k in ["panggung wayang", "wayang", "cinema"]):
-            hints.append(
-                "For nearby cinemas, suggest GSC/TGV/Star Cinemas and checking Google Maps for the closest branch."
-            )
-        if "cuti umum" in lower or "public holiday" in lower:
-            hints.append(
-                "Mention major holidays (CNY, Raya, Labour Day, Wesak, Agong's Birthday, National Day, "
-                "Malaysia Day, Deepavali, Christmas) and note that dates vary by state; check official calendars."
-            )
-        if "raya" in lower and any(k in lower for k in ["bila", "tarikh"]) and "aidilfitri" in lower:
-            hints.append(
-                "Raya Aidilfitri date depends on official rukyah/hilal announcement; advise checking JAKIM/official calendar."
-            )
-        if "universiti malaya" in lower and any(k in lower for k in ["ranking", "rank", "world"]):
-            hints.append(
-                "UM ranking changes yearly; advise checking QS World University Rankings or Times Higher Education."
-            )
-        if "jdt" in lower and any(k in lower for k in ["menang", "juara"]):
-            hints.append(
-                "JDT often dominate Liga Super; if asking latest match, advise checking recent results."
-            )
-        if any(k in lower for k in ["translate", "terjemah"]) and self._get_requested_dialect(text) == "Kelantanese":
-            hints.append(
-                "For Kelantan dialect, use: kawe (saya), demo (awak), cinto/sayang (love). "
-                "Keep it short and do not mention other dialects."
-            )
-            if "love you" in lower or "i love you" in lower:
-                hints.append(
-                    "If translating 'I love you', use: 'kawe cinto demo' with gloss 'saya sayang awak'."
-                )
-        if "ayam masak merah" in lower or ("resepi" in lower and "ayam" in lower and "merah" in lower):
-            hints.append(
-                "Ayam masak merah: goreng ayam separuh masak, tumis bawang + cili kisar, "
-                "masuk sos cili/tomato + gula/garam, masukkan ayam dan gaul."
-            )
-        if "sahur" in lower:
-            hints.append(
-                "Sahur ialah makan sebelum subuh; 'lepas sahur' merujuk awal pagi, bukan waktu berbuka."
-            )
-        if "susah-susah" in lower or "tak payah" in lower or "tidak payah" in lower:
-            hints.append(
-                "Jika pengguna kata 'tak payah' atau 'susah-susah', maksudnya tiada perlu bersusah payah. Jawab ringkas sahaja."
-            )
+        requested_dialect = None
+        for clauses, dialect, hint in _PLAYBOOK_TRIGGERS:
+            if not all(any(k in hits for k in clause) for clause in clauses):
+                continue
+            if dialect:
+                if requested_dialect is None:
+                    requested_dialect = self._get_requested_dialect(text)
+                if requested_dialect != dialect:
+                    continue
+            hints.append(hint)
         if not hints:
             return ""
         return "\n\nPLAYBOOK:\n- " + "\n- ".join(hints)
@@ -954,14 +1095,6 @@ class MalayaChatbot:
                 import logging
                 logging.warning(f"v2 input processing failed: {e}")
         
-        # v2: Vector RAG context injection
-        if self._malaya_v2_enabled and self.vector_service:
-            try:
-                v2_context = self.vector_service.get_context_for_query(malaya_normalized, top_k=3)
-            except Exception as e:
-                import logging
-                logging.warning(f"v2 vector search failed: {e}")
-
         # Step 1: Normalize (retrieval only; preserve original phrasing for generation)
         normalized_query = self.normalizer.normalize_for_retrieval(malaya_normalized)
         risk_score = self._estimate_risk_score(user_input)
@@ -1114,6 +1247,15 @@ Do NOT be robotic. Be human-like and have 'vibe'."""
                 },
             }
 
+        # v2: Vector RAG context injection. Started in a worker thread once the
+        # early-return paths are behind us and awaited with retrieval, so the
+        # lookup overlaps the condense LLM call
+        v2_context_task = None
+        if self._malaya_v2_enabled and self.vector_service:
+            v2_context_task = asyncio.ensure_future(
+                asyncio.to_thread(self._v2_vector_context, malaya_normalized)
+            )
+
         # Step 2: Contextualize Query (if history exists)
         search_query = normalized_query
         if chat_history:
@@ -1122,21 +1264,31 @@ Do NOT be robotic. Be human-like and have 'vibe'."""
             timings["condense_ms"] = round((time.perf_counter() - condense_start) * 1000, 2)
             print(f"Condensed Query: {search_query}")  # Debug log
 
-        # Step 3: Search (Tavily + local chunks) using the contextualized query
-        # Retriever is synchronous for now, let's keep it (or run in threadpool if slow)
+        # Step 3: Search (Tavily + local chunks) using the contextualized query.
+        # Search and the utility tools are blocking I/O: run them in worker
+        # threads side by side so they neither stall the event loop nor wait
+        # on each other
         retrieval_start = time.perf_counter()
         if self.rag_service and hasattr(self.rag_service, "search_raw"):
-            search_results = self.rag_service.search_raw(
+            search_task = asyncio.to_thread(
+                self.rag_service.search_raw,
                 search_query,
                 k=self.config["rag"]["k"],
                 use_web=use_web_search,
             )
         else:
-            search_results = self.retriever.search(
+            search_task = asyncio.to_thread(
+                self.retriever.search,
                 search_query,
                 k=self.config["rag"]["k"],
                 use_web=use_web_search
             )
+        search_results, utility_context = await asyncio.gather(
+            search_task,
+            asyncio.to_thread(self._maybe_run_utility, user_input),
+        )
+        if v2_context_task is not None:
+            v2_context = await v2_context_task
         timings["retrieval_ms"] = round((time.perf_counter() - retrieval_start) * 1000, 2)
 
         no_sources = not search_results
@@ -1150,7 +1302,6 @@ Do NOT be robotic. Be human-like and have 'vibe'."""
             context_str = "(No external sources found. Answer using your general knowledge.)"
             sources_list = []
 
-        utility_context = self._maybe_run_utility(user_input)
         if utility_context:
             context_str = f"[UTILITY]\n{utility_context}\n\n{context_str}"
         
@@ -1722,6 +1873,9 @@ Descriptions (one per line):"""
     def _sanitize_tool_output(self, content: str) -> str:
         if not content:
             return ""
+        # One scan of the whole output; the per-line filter only runs when it hits
+        if not TOOL_INJECTION_PATTERN.search(content):
+            return "\n".join(line.strip() for line in content.splitlines() if line.strip())
         cleaned_lines = []
         for line in content.splitlines():
             if not line.strip():
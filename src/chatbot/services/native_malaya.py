@@ -8,6 +8,10 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# Parsed shortform dictionaries shared by every NativeMalaya instance, keyed by
+# the (path, mtime) of each source file so edits to a lexicon are picked up
+_SHORTFORMS_CACHE = {}
+
 class NativeMalaya:
     """
     Native implementation of Malaya NLP features using HuggingFace Transformers directly.
@@ -41,6 +45,22 @@ class NativeMalaya:
         self._load_local_data()
 
     def _load_local_data(self):
+        schema_path = os.path.join(os.path.dirname(__file__), "..", "..", "data", "shortforms.json")
+        dictionary_paths = [
+            os.path.join("data", "dictionaries", filename)
+            for filename in ["malaya_shortforms.json", "shortforms.json"]
+        ]
+        signature = tuple(
+            (os.path.abspath(path), os.path.getmtime(path))
+            for path in [schema_path, *dictionary_paths]
+            if os.path.exists(path)
+        )
+        cached = _SHORTFORMS_CACHE.get(signature)
+        if cached is not None:
+            self.shortforms = cached
+            logger.info(f"Reusing {len(self.shortforms)} cached shortforms.")
+            return
+
         try:
             import json
             def add_term(short, full):
@@ -51,7 +71,6 @@ class NativeMalaya:
                     self.shortforms[key] = str(full).strip()
 
             # Load unified schema lexicon if present
-            schema_path = os.path.join(os.path.dirname(__file__), "..", "..", "data", "shortforms.json")
             if os.path.exists(schema_path):
                 with open(schema_path, "r", encoding="utf-8") as f:
                     data = json.load(f)
@@ -72,8 +91,7 @@ class NativeMalaya:
                                     add_term(k, v)
 
             # Load Shortforms from dictionary sources
-            for filename in ["malaya_shortforms.json", "shortforms.json"]:
-                path = os.path.join("data", "dictionaries", filename)
+            for path in dictionary_paths:
                 if not os.path.exists(path):
                     continue
                 with open(path, "r", encoding="utf-8") as f:
@@ -85,6 +103,7 @@ class NativeMalaya:
                             add_term(item["short"], item["full"])
 
             logger.info(f"Loaded {len(self.shortforms)} shortforms from local dictionaries.")
+            _SHORTFORMS_CACHE[signature] = self.shortforms
         except Exception as e:
             logger.error(f"Failed to load local malaya data: {e}")
 
@@ -109,15 +128,11 @@ class NativeMalaya:
     def normalize(self, text: str) -> str:
         # Fast path: Dictionary-based normalization
         if self.shortforms:
-            words = text.split()
-            normalized = []
-            for word in words:
-                clean_word = word.lower().strip('.,!?')
-                if clean_word in self.shortforms:
-                    normalized.append(self.shortforms[clean_word])
-                else:
-                    normalized.append(word)
-            return " ".join(normalized)
+            # One hash lookup per token; a missing key keeps the original word
+            lookup = self.shortforms.get
+            return " ".join(
+                lookup(word.lower().strip('.,!?'), word) for word in text.split()
+            )
 
         # Fallback path: Neural normalization
         tokenizer, model = self._get_model("normalize", "mesolitica/t5-super-tiny-bahasa-cased", AutoModelForSeq2SeqLM)
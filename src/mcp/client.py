@@ -142,39 +142,59 @@ class MCPClientManager:
 
     async def connect_all(self):
         """Connect to all configured MCP servers."""
-        for server_name, server_config in self.mcp_config.items():
-            try:
-                command = server_config.get("command")
-                args = server_config.get("args", [])
-                env = server_config.get("env", {}).copy()
-                
-                # Resolve environment variables
-                for key, value in env.items():
-                    if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                        env_var = value[2:-1]
-                        env[key] = os.environ.get(env_var, "")
-                
-                # Merge with system env
-                full_env = os.environ.copy()
-                full_env.update(env)
-                
-                # Ensure /opt/homebrew/bin is in PATH for npx/node
-                current_path = full_env.get("PATH", "")
-                if "/opt/homebrew/bin" not in current_path:
-                    full_env["PATH"] = f"/opt/homebrew/bin:{current_path}"
-                
-                # Verify command exists (e.g. npx)
-                if not shutil.which(command):
-                    print(f"Warning: Command '{command}' not found. Skipping MCP server '{server_name}'.")
-                    continue
-
-                client = StdIOServerClient(command, args, full_env)
-                await client.start()
+        # Servers start independently (each is its own subprocess handshake), so
+        # bring them up concurrently; registration keeps config order
+        names = list(self.mcp_config)
+        clients = await asyncio.gather(
+            *(self._connect_server(name, self.mcp_config[name]) for name in names)
+        )
+        for server_name, client in zip(names, clients):
+            if client is not None:
                 self.servers[server_name] = client
-                print(f"Connected to MCP server: {server_name}")
-                
-            except Exception as e:
-                print(f"Failed to connect to MCP server '{server_name}': {e}")
+
+    async def _connect_server(self, server_name: str, server_config: Dict) -> Optional[StdIOServerClient]:
+        """Start one MCP server; returns None if it is skipped or fails."""
+        try:
+            command = server_config.get("command")
+            args = server_config.get("args", [])
+            env = server_config.get("env", {}).copy()
+            
+            # Resolve environment variables
+            for key, value in env.items():
+                if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
+                    env_var = value[2:-1]
+                    env[key] = os.environ.get(env_var, "")
+            
+            # Merge with system env
+            full_env = os.environ.copy()
+            full_env.update(env)
+            
+            # Ensure /opt/homebrew/bin is in PATH for npx/node
+            current_path = full_env.get("PATH", "")
+            if "/opt/homebrew/bin" not in current_path:
+                full_env["PATH"] = f"/opt/homebrew/bin:{current_path}"
+            
+            # Verify command exists (e.g. npx)
+            if not shutil.which(command):
+                print(f"Warning: Command '{command}' not found. Skipping MCP server '{server_name}'.")
+                return None
+
+            client = StdIOServerClient(command, args, full_env)
+            await client.start()
+            print(f"Connected to MCP server: {server_name}")
+            return client
+            
+        except Exception as e:
+            print(f"Failed to connect to MCP server '{server_name}': {e}")
+            return None
+
+    async def _fetch_tools(self, server_name: str, client: StdIOServerClient) -> List[Dict]:
+        try:
+            result = await client.request("tools/list", {})
+            return result.get("tools", [])
+        except Exception as e:
+            print(f"Error listing tools from '{server_name}': {e}")
+            return []
 
     async def list_tools(self) -> List[Dict]:
         """
@@ -184,11 +204,14 @@ class MCPClientManager:
         all_tools = []
         self.tools = {}
         
-        for server_name, client in self.servers.items():
+        # Query every server at once, then merge in server order so name
+        # clashes resolve exactly as a sequential walk would
+        servers = list(self.servers.items())
+        tool_lists = await asyncio.gather(
+            *(self._fetch_tools(server_name, client) for server_name, client in servers)
+        )
+        for (server_name, client), tool_list in zip(servers, tool_lists):
             try:
-                result = await client.request("tools/list", {})
-                tool_list = result.get("tools", [])
-                
                 for tool in tool_list:
                     tool_name = tool["name"]
                     
@@ -204,6 +227,7 @@ class MCPClientManager:
                         "parameters": tool.get("inputSchema", {})
                     })
             except Exception as e:
+                # A malformed reply only costs that server its tools
                 print(f"Error listing tools from '{server_name}': {e}")
                 
         return all_tools
@@ -40,6 +40,16 @@ class SQLiteStore:
                 )
                 """
             )
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS slang_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT,
+                    created_at REAL,
+                    ttl INTEGER
+                )
+                """
+            )
             cursor.execute(
                 """
                 CREATE TABLE IF NOT EXISTS project_memory (
@@ -123,6 +133,14 @@ class SQLiteStore:
     def tool_cache_set(self, key: str, value: str, ttl: int) -> None:
         self._cache_set("tool_cache", key, value, ttl)
 
+    def slang_cache_get(self, key: str) -> Optional[dict]:
+        raw = self._cache_get("slang_cache", key)
+        return json.loads(raw) if raw else None
+
+    def slang_cache_set(self, key: str, value: dict, ttl: int = 0) -> None:
+        # Slang normalizations don't go stale; ttl 0 keeps them indefinitely
+        self._cache_set("slang_cache", key, value, ttl)
+
     def get_project_memory(self, project_id: str) -> Optional[dict]:
         with self._lock:
             cursor = self._conn.cursor()
@@ -0,0 +1,50 @@
+import pytest
+
+from src.chatbot import engine
+from src.chatbot.engine import MalayaChatbot
+
+
+@pytest.fixture(params=["automaton", "fallback"])
+def bot(request, monkeypatch):
+    """A chatbot with only the matching state set up, for both backends."""
+    if request.param == "automaton":
+        if engine.ahocorasick is None:
+            pytest.skip("pyahocorasick not installed")
+    else:
+        monkeypatch.setattr(engine, "ahocorasick", None)
+        monkeypatch.setattr(engine, "_PLAYBOOK_AUTOMATON", None)
+    chatbot = MalayaChatbot.__new__(MalayaChatbot)
+    chatbot._slang_markers = None
+    chatbot._slang_phrases = None
+    chatbot._slang_automaton = None
+    return chatbot
+
+
+def test_playbook_hints_follow_trigger_rules(bot):
+    assert bot._build_playbook_hint("") == ""
+    assert bot._build_playbook_hint("hello there") == ""
+
+    hint = bot._build_playbook_hint("Macam mana nak mohon PTPTN?")
+    assert "PTPTN" in hint and hint.startswith("\n\nPLAYBOOK:\n- ")
+
+    # Every clause must hit: "lhdn" alone isn't enough
+    assert bot._build_playbook_hint("lhdn tax filing") == ""
+    assert "scam LHDN" in bot._build_playbook_hint("ada panggilan dari LHDN")
+
+    # "ayam masak merah" itself satisfies the recipe rule
+    assert "Ayam masak merah" in bot._build_playbook_hint("cara buat ayam masak merah")
+
+
+def test_playbook_dialect_hints_keep_order(bot):
+    hint = bot._build_playbook_hint("tolong terjemah i love you dalam loghat kelantan")
+    lines = hint.split("\n- ")[1:]
+    assert lines[0].startswith("For Kelantan dialect")
+    assert lines[1].startswith("If translating 'I love you'")
+    assert bot._build_playbook_hint("tolong terjemah i love you") == ""
+
+
+def test_slang_detection_markers_are_whole_words(bot):
+    assert bot._has_slang_or_shortform("xleh datang")
+    assert bot._has_slang_or_shortform("Boleh tak, XLEH?")
+    assert not bot._has_slang_or_shortform("")
+    assert not bot._has_slang_or_shortform("axlehx x_xleh")
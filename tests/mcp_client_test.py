@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from src.mcp.client import MCPClientManager
+
+
+class FakeServer:
+    """Stands in for a connected StdIOServerClient."""
+
+    def __init__(self, tools, delay=0.0, error=None):
+        self.tools = tools
+        self.delay = delay
+        self.error = error
+
+    async def request(self, method, params=None):
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return {"tools": [{"name": name, "description": desc} for name, desc in self.tools]}
+
+
+def _manager(servers):
+    manager = MCPClientManager(config_path="does-not-exist.yaml")
+    manager.servers = servers
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_list_tools_merges_in_server_order_when_names_clash():
+    # The first server answers last; the merge must still follow server order
+    first = FakeServer([("search", "from first"), ("geocode", "first only")], delay=0.05)
+    second = FakeServer([("search", "from second")])
+    manager = _manager({"first": first, "second": second})
+
+    tools = await manager.list_tools()
+
+    assert [(t["name"], t["description"]) for t in tools] == [
+        ("search", "from first"),
+        ("geocode", "first only"),
+        ("search", "from second"),
+    ]
+    # Like a sequential walk, the later server wins the registry slot
+    assert manager.tools["search"]["server"] == "second"
+    assert manager.tools["geocode"]["client"] is first
+
+
+@pytest.mark.asyncio
+async def test_list_tools_skips_failing_servers():
+    broken = FakeServer([], error=RuntimeError("server crashed"))
+    healthy = FakeServer([("directions", "")])
+    manager = _manager({"broken": broken, "healthy": healthy})
+
+    tools = await manager.list_tools()
+
+    assert [t["name"] for t in tools] == ["directions"]
+
+
+@pytest.mark.asyncio
+async def test_connect_all_registers_in_config_order(monkeypatch):
+    manager = _manager({})
+    manager.mcp_config = {"slow": {"delay": 0.05}, "missing": None, "fast": {"delay": 0.0}}
+
+    async def fake_connect(name, config):
+        if config is None:
+            return None
+        await asyncio.sleep(config["delay"])
+        return f"client-{name}"
+
+    monkeypatch.setattr(manager, "_connect_server", fake_connect)
+    await manager.connect_all()
+
+    assert list(manager.servers.items()) == [("slow", "client-slow"), ("fast", "client-fast")]
+
+
+@pytest.mark.asyncio
+async def test_list_tools_isolates_malformed_server_replies():
+    class MalformedServer(FakeServer):
+        async def request(self, method, params=None):
+            return {"tools": [{"description": "no name"}]}
+
+    healthy = FakeServer([("directions", "")])
+    manager = _manager({"malformed": MalformedServer([]), "healthy": healthy})
+
+    tools = await manager.list_tools()
+
+    assert [t["name"] for t in tools] == ["directions"]
+    assert list(manager.tools) == ["directions"]
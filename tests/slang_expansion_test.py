@@ -0,0 +1,125 @@
+import threading
+
+import pytest
+
+from src.chatbot import dspy_optimizer
+from src.chatbot.dspy_optimizer import DSPyOptimizer, TermMatcher
+
+
+@pytest.fixture(params=["automaton", "regex"])
+def matcher_backend(request, monkeypatch):
+    """Runs a test against both TermMatcher backends."""
+    if request.param == "automaton":
+        if dspy_optimizer.ahocorasick is None:
+            pytest.skip("pyahocorasick not installed")
+    else:
+        monkeypatch.setattr(dspy_optimizer, "ahocorasick", None)
+    return request.param
+
+
+def test_term_matcher_whole_words_only(matcher_backend):
+    matcher = TermMatcher(["nk", "mcm mane"])
+    text = "nk pergi, mcm mane? snk nkk x_nk nk_x nk2 nk-ok"
+    assert [term for _, _, term in matcher.spans(text)] == ["nk", "mcm mane", "nk"]
+
+
+def test_term_matcher_prefers_longest_term(matcher_backend):
+    matcher = TermMatcher(["xleh", "xleh la"])
+    assert matcher.spans("xleh la bro") == [(0, 7, "xleh la")]
+
+
+def test_expand_slang_boundaries_match_across_backends(matcher_backend):
+    optimizer = DSPyOptimizer()
+    expanded, mapping = optimizer.expand_slang("Xleh datang skrg, nk_tp tp_nk tp.")
+    assert expanded == "tak boleh datang sekarang, nk_tp tp_nk tapi."
+    assert mapping == {"xleh": "tak boleh", "skrg": "sekarang", "tp": "tapi"}
+
+
+def test_preprocess_expands_fixed_shortforms_without_llm():
+    optimizer = DSPyOptimizer()
+
+    def no_llm(**kwargs):
+        raise AssertionError("normalizer LLM should not be called")
+
+    optimizer.slang_normalizer = no_llm
+    result = optimizer.preprocess_query("xleh datang skrg")
+    assert result["normalized"] == "tak boleh datang sekarang"
+
+
+def test_preprocess_uses_llm_for_unresolved_shortforms():
+    optimizer = DSPyOptimizer()
+    calls = []
+
+    class Result:
+        standard_text = "macam mana nak buat ini? dah cuba banyak kali tapi tak jadi"
+        slang_mapping = "{}"
+
+    def normalizer(slang_text):
+        calls.append(slang_text)
+        return Result()
+
+    optimizer.slang_normalizer = normalizer
+    result = optimizer.preprocess_query("mcm mane nk buat ni? dh try byk kali tp xjd")
+    assert calls
+    assert result["normalized"] == Result.standard_text
+
+
+class ThreadRecordingStore:
+    """slang_cache backend that records which thread each call ran on."""
+
+    def __init__(self, entries=None):
+        self.entries = dict(entries or {})
+        self.threads = []
+
+    def slang_cache_get(self, key):
+        self.threads.append(threading.get_ident())
+        return self.entries.get(key)
+
+    def slang_cache_set(self, key, entry):
+        self.threads.append(threading.get_ident())
+        self.entries[key] = entry
+
+
+@pytest.mark.asyncio
+async def test_apreprocess_reads_persistent_cache_off_the_loop():
+    entry = {"normalized": "banyak", "slang_mapping": '{"byk": "banyak"}'}
+    store = ThreadRecordingStore({"byk": entry})
+    optimizer = DSPyOptimizer(cache_backend=store)
+
+    result = await optimizer.apreprocess_query("byk")
+
+    assert result == {"original": "byk", **entry}
+    assert store.threads and threading.get_ident() not in store.threads
+
+
+@pytest.mark.asyncio
+async def test_apreprocess_falls_back_without_predictor_acall():
+    # Older DSPy: neither modules nor predictors have acall
+    class Result:
+        standard_text = "banyak"
+        slang_mapping = '{"byk": "banyak"}'
+
+    class OldPredict:
+        def __call__(self, slang_text):
+            return Result()
+
+    class OldNormalizer:
+        def __init__(self):
+            self.translator = OldPredict()
+
+        def __call__(self, slang_text):
+            return self.translator(slang_text=slang_text)
+
+        aforward = dspy_optimizer.SlangNormalizer.aforward
+
+    store = ThreadRecordingStore()
+    optimizer = DSPyOptimizer(cache_backend=store)
+    optimizer.slang_normalizer = OldNormalizer()
+
+    result = await optimizer.apreprocess_query("byk")
+    assert result["normalized"] == "banyak"
+    assert store.entries["byk"]["normalized"] == "banyak"
+    assert threading.get_ident() not in store.threads
+
+    # The module's own aforward also copes with a predictor lacking acall
+    assert (await OldNormalizer().aforward(slang_text="byk")).standard_text == "banyak"
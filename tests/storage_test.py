@@ -38,3 +38,21 @@ def test_sqlite_store_cache_and_memory():
         feedback = store.get_feedback("feedback-1")
         assert feedback["rating"] == "up"
         assert feedback["message_id"] == "msg-1"
+
+
+def test_sqlite_store_slang_cache_round_trip():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = SQLiteStore(os.path.join(tmpdir, "test.db"))
+        assert store.slang_cache_get("xleh datang") is None
+
+        entry = {"normalized": "tak boleh datang", "slang_mapping": '{"xleh": "tak boleh"}'}
+        store.slang_cache_set("xleh datang", entry)
+        assert store.slang_cache_get("xleh datang") == entry
+
+        # Later writes replace the entry; non-ASCII text survives the trip
+        store.slang_cache_set("xleh datang", {"normalized": "tak boleh datang — ok"})
+        assert store.slang_cache_get("xleh datang") == {"normalized": "tak boleh datang — ok"}
+
+        # Persisted: a fresh store on the same file still has it
+        reopened = SQLiteStore(os.path.join(tmpdir, "test.db"))
+        assert reopened.slang_cache_get("xleh datang")["normalized"] == "tak boleh datang — ok"
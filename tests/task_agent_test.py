@@ -0,0 +1,176 @@
+import asyncio
+import json
+
+import pytest
+
+from src.chatbot.agents.task_agent import TaskAgent
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeLLM:
+    """Scripted LLM: answers by phase and records every executor prompt."""
+
+    def __init__(self, plan, results=None, fail=None):
+        self.plan = plan
+        self.results = results or {}
+        self.fail = fail or {}
+        self.executed = []
+
+    async def ainvoke(self, messages):
+        prompt = messages if isinstance(messages, str) else messages[-1].content
+        head = prompt.split("\n")[0]
+        phase = head.lower()
+        if phase.startswith(("plan", "break down")):
+            return FakeResponse(self.plan)
+        if phase.startswith("summar"):
+            return FakeResponse("summary")
+        if phase.startswith("solve"):
+            return FakeResponse(self.results.get("SOLVE", "not json"))
+        self.executed.append(prompt)
+        for desc, error in self.fail.items():
+            if desc in head:
+                raise error
+        await asyncio.sleep(0)
+        for desc, result in self.results.items():
+            if desc in head:
+                return FakeResponse(result)
+        return FakeResponse("done")
+
+
+def _plan(*steps):
+    return json.dumps([{"id": i, "desc": d, "depends_on": deps} for i, d, deps in steps])
+
+
+def _executed_index(llm, desc):
+    return next(i for i, p in enumerate(llm.executed) if desc in p.split("\n")[0])
+
+
+@pytest.mark.asyncio
+async def test_execute_all_runs_dependencies_first_and_passes_results():
+    llm = FakeLLM(
+        _plan(
+            (1, "Search restaurants", []),
+            (2, "Check the weather", []),
+            (3, "Get directions", [1]),
+        ),
+        results={"Search restaurants": "Nasi Kandar Pelita", "Check the weather": "sunny"},
+    )
+    result = await TaskAgent(llm).execute("plan my dinner")
+
+    directions = _executed_index(llm, "Get directions")
+    assert directions > _executed_index(llm, "Search restaurants")
+    assert "Nasi Kandar Pelita" in llm.executed[directions]
+    assert "sunny" not in llm.executed[directions]
+
+    # Reported in plan order regardless of completion order
+    assert [s["description"] for s in result["steps"]] == [
+        "Search restaurants", "Check the weather", "Get directions"
+    ]
+    assert result["result"] == "summary"
+
+
+@pytest.mark.asyncio
+async def test_execute_all_breaks_dependency_cycles():
+    llm = FakeLLM(_plan((1, "Book a table", [2]), (2, "Pay the deposit", [1])))
+    result = await TaskAgent(llm).execute("book dinner")
+    assert len(result["steps"]) == 2
+    assert _executed_index(llm, "Book a table") == 0
+
+
+@pytest.mark.asyncio
+async def test_execute_all_propagates_non_transient_failures():
+    llm = FakeLLM(
+        _plan((1, "Search restaurants", []), (2, "Get directions", [1])),
+        fail={"Search restaurants": ValueError("bad tool input")},
+    )
+    with pytest.raises(ValueError):
+        await TaskAgent(llm).execute("plan my dinner")
+    # Nothing downstream of the failed step ran, and it wasn't retried
+    assert len(llm.executed) == 1
+
+
+def test_coalesce_plan_merges_adjacent_near_duplicates():
+    plan = [
+        {"id": 1, "desc": "Search restaurants in KLCC", "depends_on": []},
+        {"id": 2, "desc": "Search restaurants in KLCC filtered by rating", "depends_on": [1]},
+        {"id": 3, "desc": "Check weather tomorrow", "depends_on": []},
+        {"id": 4, "desc": "Get directions to top restaurant", "depends_on": [2]},
+    ]
+    units = TaskAgent._coalesce_plan(plan)
+    assert [[s["id"] for s in u["subtasks"]] for u in units] == [[1, 2], [3], [4]]
+    # Dependencies on a merged step point at its unit
+    assert units[2]["depends_on"] == [1]
+
+
+@pytest.mark.asyncio
+async def test_coalesced_steps_are_split_back_per_step():
+    llm = FakeLLM(
+        _plan(
+            (1, "Search restaurants in KLCC", []),
+            (2, "Search restaurants in KLCC filtered by rating", [1]),
+        ),
+        results={"closely related": '{"1": "all of them", "2": "the good ones"}'},
+    )
+    result = await TaskAgent(llm).execute("find food")
+    assert len(llm.executed) == 1
+    assert [s["result"] for s in result["steps"]] == ["all of them", "the good ones"]
+
+
+@pytest.mark.asyncio
+async def test_single_shot_answers_in_one_call():
+    llm = FakeLLM("1. unused", results={
+        "SOLVE": '{"steps": ["a", "b"], "results": ["ra", "rb"], "summary": "S"}'
+    })
+    result = await TaskAgent(llm).execute("simple task", single_shot=True)
+    assert result == {
+        "steps": [
+            {"step": 1, "description": "a", "result": "ra"},
+            {"step": 2, "description": "b", "result": "rb"},
+        ],
+        "result": "S",
+    }
+    assert llm.executed == []
+
+
+@pytest.mark.asyncio
+async def test_single_shot_falls_back_to_graph():
+    # Unparseable reply: the full plan/execute/summarize graph runs instead
+    llm = FakeLLM("1. Only step")
+    result = await TaskAgent(llm).execute("simple task", single_shot=True)
+    assert result["result"] == "summary"
+    assert len(llm.executed) == 1
+
+    # Tool-like task with an MCP manager attached skips single-shot entirely
+    llm = FakeLLM("1. Only step", results={
+        "SOLVE": '{"steps": [], "results": [], "summary": "S"}'
+    })
+    result = await TaskAgent(llm, mcp_manager=object()).execute(
+        "search places near KLCC", single_shot=True
+    )
+    assert result["result"] == "summary"
+
+
+@pytest.mark.asyncio
+async def test_execute_all_retries_only_failed_calls():
+    class RateLimited(Exception):
+        status_code = 429
+
+    class FlakyLLM(FakeLLM):
+        async def ainvoke(self, messages):
+            if "Check the weather" in messages[-1].content and not self.fail_once:
+                self.fail_once = True
+                raise RateLimited("slow down")
+            return await super().ainvoke(messages)
+
+    llm = FlakyLLM(_plan((1, "Search restaurants", []), (2, "Check the weather", [])))
+    llm.fail_once = False
+    agent = TaskAgent(llm)
+    agent.RETRY_POLICY = agent.RETRY_POLICY._replace(initial_interval=0.01)
+    result = await agent.execute("plan my dinner")
+
+    assert [s["result"] for s in result["steps"]] == ["done", "done"]
+    assert sum("Search restaurants" in p for p in llm.executed) == 1